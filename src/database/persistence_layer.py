@@ -7,12 +7,13 @@ abstracting away the database implementation details from the rest of the applic
 
 import os
 import logging
+from contextlib import contextmanager
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 from .optimized_queries import DatabaseOptimizer
 from ..models import Exercise, Progress, UserProfile
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 
 # Configure logging
 logging.basicConfig(
@@ -29,15 +30,29 @@ class PersistenceLayer:
     abstracting away the database implementation details from the rest of the application.
     """
     
-    def __init__(self, session):
-        """Initialize the persistence layer with a database session.
+    def __init__(self, session_factory):
+        """Initialize the persistence layer with a session factory.
+
+        Sessions are scoped per thread, and each write commits (or rolls
+        back) its own transaction without closing the session.
 
         Args:
-            session (sqlalchemy.orm.Session): Database session to use
+            session_factory (sqlalchemy.orm.sessionmaker): Factory for new sessions
         """
-        self.session = session
-        self.optimizer = DatabaseOptimizer(session.get_bind().url)
+        self.Session = scoped_session(session_factory)
+        self.optimizer = DatabaseOptimizer(self.Session.get_bind().url)
         logger.info("PersistenceLayer initialized")
+
+    @contextmanager
+    def _write_scope(self):
+        """Provide a transactional scope on the current thread's session."""
+        session = self.Session()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
     
     # User Profile Operations
     
@@ -63,11 +78,10 @@ class PersistenceLayer:
         Returns:
             UserProfile: Added user
         """
-        with self.session as session:
+        with self._write_scope() as session:
             session.add(user)
-            session.commit()
             logger.info(f"Added new user: {user.username}")
-            return user
+        return user
     
     def get_user(self, user_id: str) -> Optional[UserProfile]:
         """
@@ -79,10 +93,14 @@ class PersistenceLayer:
         Returns:
             Optional[UserProfile]: User profile or None if not found
         """
-        return self.session.query(UserProfile).filter(UserProfile.user_id == user_id).first()
+        return (
+            self.Session.query(UserProfile)
+            .filter(UserProfile.user_id == user_id)
+            .first()
+        )
     
     def get_user(self, username: str):
-        return self.session.query(UserProfile).filter_by(username=username).first()
+        return self.Session.query(UserProfile).filter_by(username=username).first()
     
     def update_user(self, user: UserProfile) -> UserProfile:
         """
@@ -147,7 +165,7 @@ class PersistenceLayer:
         Args:
             exercise (Exercise): Exercise to add
         """
-        with self.session as session:
+        with self._write_scope() as session:
             session.add(exercise)
             logger.info(f"Added new exercise: {exercise.name}")
     
@@ -300,11 +318,10 @@ class PersistenceLayer:
         Returns:
             Progress: Updated progress record
         """
-        with self.session as session:
+        with self._write_scope() as session:
             session.add(progress)
-            session.commit()
             logger.info(f"Updated progress record {progress.id}")
-            return progress
+        return progress
     
     def delete_progress(self, progress_id: str) -> bool:
         """
@@ -577,10 +594,14 @@ class PersistenceLayer:
         Returns:
             List[Exercise]: List of exercises in the learning path
         """
-        user = self.session.query(UserProfile).filter_by(user_id=user_id).first()
-        if not user:
+        row = (
+            self.Session.query(UserProfile.skill_level)
+            .filter(UserProfile.id == user_id)
+            .first()
+        )
+        if not row:
             return []
-        return self.session.query(Exercise).filter_by(difficulty=user.skill_level).all()
+        return self.Session.query(Exercise).filter_by(difficulty=row.skill_level).all()
 
     def evaluate_progress(self, user_id: str):
         """
@@ -592,10 +613,12 @@ class PersistenceLayer:
         Returns:
             Dict[str, str]: Progress evaluation
         """
-        user = self.session.query(UserProfile).filter_by(user_id=user_id).first()
-        if not user:
-            return {}
-        return {p.exercise_id: p.status for p in user.progress}
+        rows = (
+            self.Session.query(Progress.exercise_id, Progress.status)
+            .filter(Progress.user_id == user_id)
+            .all()
+        )
+        return {row.exercise_id: row.status for row in rows}
 
     def get_user_exercises(self, user_id: str) -> List[Exercise]:
         """
@@ -627,6 +650,7 @@ def get_persistence_layer() -> PersistenceLayer:
     global _persistence_layer
     if _persistence_layer is None:
         engine = create_engine('sqlite:///:memory:')
-        Session = sessionmaker(bind=engine)
-        _persistence_layer = PersistenceLayer(Session())
+        _persistence_layer = PersistenceLayer(
+            sessionmaker(bind=engine, expire_on_commit=False)
+        )
     return _persistence_layer
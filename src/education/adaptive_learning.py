@@ -1,16 +1,20 @@
-from typing import Dict, List, Set, Optional, Union, Any
+from typing import DefaultDict, Deque, Dict, List, Set, Optional, Tuple, Any
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
-import warnings
+from operator import itemgetter
+from types import MappingProxyType
+import heapq
+import time
 from ..models import UserProfile
 
 try:
     import numpy as np
-    NUMPY_AVAILABLE = True
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
 except ImportError:
-    warnings.warn("NumPy is not available. Using fallback implementation.")
-    NUMPY_AVAILABLE = False
+    NUMBA_AVAILABLE = False
 
 
 class SkillLevel(Enum):
@@ -19,13 +23,27 @@ class SkillLevel(Enum):
     ADVANCED = "advanced"
 
 
-@dataclass
+_DIFFICULTY_WEIGHTS = {
+    SkillLevel.BEGINNER: 1.0,
+    SkillLevel.INTERMEDIATE: 1.5,
+    SkillLevel.ADVANCED: 2.0,
+}
+
+
+@dataclass(slots=True)
 class KnowledgeNode:
     concept: str
     prerequisites: Set[str]
     difficulty: SkillLevel
     mastery_level: float = 0.0
-    last_practiced: Optional[datetime] = None
+    last_practiced: Optional[float] = None
+    precomputed_weight: float = 1.0
+
+    @property
+    def last_practiced_dt(self) -> Optional[datetime]:
+        if self.last_practiced is None:
+            return None
+        return datetime.fromtimestamp(self.last_practiced)
 
 
 class KnowledgeSpace:
@@ -41,131 +59,131 @@ class KnowledgeSpace:
             "branch": KnowledgeNode(concept="git_branch", prerequisites={"git_commit"}, difficulty=SkillLevel.INTERMEDIATE),
             "merge": KnowledgeNode(concept="git_merge", prerequisites={"git_branch"}, difficulty=SkillLevel.INTERMEDIATE),
         }
+        for node in self._knowledge_graph.values():
+            node.precomputed_weight = _DIFFICULTY_WEIGHTS.get(node.difficulty, 1.0)
 
     def update_mastery(self, concept: str, performance: float) -> None:
-        if concept in self._knowledge_graph:
-            node = self._knowledge_graph[concept]
+        node = self._knowledge_graph.get(concept)
+        if node is not None:
             node.mastery_level = min(1.0, node.mastery_level + performance * 0.1)
-            node.last_practiced = datetime.now()
+            node.last_practiced = time.time()
 
 
 class SkillMatrix:
     def __init__(self, knowledge_space: KnowledgeSpace):
         self.knowledge_space = knowledge_space
         self.skill_dimensions = ["concept_understanding", "practical_application", "problem_solving"]
-        self._difficulty_weights = {SkillLevel.BEGINNER: 1.0, SkillLevel.INTERMEDIATE: 1.5, SkillLevel.ADVANCED: 2.0}
-
-    def _get_difficulty_weight(self, difficulty: SkillLevel) -> float:
-        return self._difficulty_weights.get(difficulty, 1.0)
-
-    def calculate_skill_vector(self, user_performance: Dict[str, float]) -> Union[np.ndarray, List[float]]:
-        if not user_performance:
-            return np.zeros(len(self.skill_dimensions)) if NUMPY_AVAILABLE else [0.0] * len(self.skill_dimensions)
 
-        if NUMPY_AVAILABLE:
-            return self._calculate_with_numpy(user_performance)
-        return self._calculate_without_numpy(user_performance)
-
-    def _calculate_with_numpy(self, user_performance: Dict[str, float]) -> np.ndarray:
-        skill_vector = np.zeros(len(self.skill_dimensions))
-        total_weight = 0
+    def calculate_skill_vector(
+        self, user_performance: Dict[str, float]
+    ) -> Tuple[float, float, float]:
+        graph = self.knowledge_space._knowledge_graph
+        weighted_sum = 0.0
+        total_weight = 0.0
 
         for concept, performance in user_performance.items():
-            if concept in self.knowledge_space._knowledge_graph:
-                node = self.knowledge_space._knowledge_graph[concept]
-                weight = self._get_difficulty_weight(node.difficulty)
+            node = graph.get(concept)
+            if node is not None:
+                weight = node.precomputed_weight
                 total_weight += weight
-                skill_vector += np.array([
-                    performance * weight,
-                    performance * weight,
-                    performance * weight * 0.9
-                ])
-
-        return skill_vector / total_weight if total_weight > 0 else skill_vector
+                weighted_sum += performance * weight
 
-    def _calculate_without_numpy(self, user_performance: Dict[str, float]) -> List[float]:
-        skill_vector = [0.0] * len(self.skill_dimensions)
-        total_weight = 0
+        score = weighted_sum / total_weight if total_weight > 0 else 0.0
+        return (score, score, score * 0.9)
 
-        for concept, performance in user_performance.items():
-            if concept in self.knowledge_space._knowledge_graph:
-                node = self.knowledge_space._knowledge_graph[concept]
-                weight = self._get_difficulty_weight(node.difficulty)
-                total_weight += weight
-                skill_vector[0] += performance * weight
-                skill_vector[1] += performance * weight
-                skill_vector[2] += performance * weight * 0.9
 
-        return [score / total_weight if total_weight > 0 else score for score in skill_vector]
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _skill_vector_kernel(user_ptr, weights, performances, out):
+        for user in prange(user_ptr.size - 1):
+            weighted_sum = 0.0
+            total_weight = 0.0
+            for i in range(user_ptr[user], user_ptr[user + 1]):
+                weighted_sum += weights[i] * performances[i]
+                total_weight += weights[i]
+            score = weighted_sum / total_weight if total_weight > 0 else 0.0
+            out[user, 0] = score
+            out[user, 1] = score
+            out[user, 2] = score * 0.9
 
 
 class LearningPatternRecognizer:
-    def __init__(self):
-        self.pattern_history: List[Dict[str, float]] = []
+    def __init__(self, history_window: int = 1024):
+        self.pattern_history: Deque[Dict[str, float]] = deque(maxlen=history_window)
         self.min_pattern_length = 3
+        self._concept_sum: DefaultDict[str, float] = defaultdict(float)
+        self._concept_count: DefaultDict[str, int] = defaultdict(int)
+        self._first_mean: Optional[float] = None
+        self._last_mean: Optional[float] = None
+
+    @staticmethod
+    def _event_mean(event: Dict[str, float]) -> float:
+        return sum(event.values()) / len(event)
 
     def add_learning_event(self, event: Dict[str, float]) -> None:
+        evicted = len(self.pattern_history) == self.pattern_history.maxlen
+        if evicted:
+            for concept, score in self.pattern_history[0].items():
+                self._concept_count[concept] -= 1
+                if self._concept_count[concept]:
+                    self._concept_sum[concept] -= score
+                else:
+                    del self._concept_count[concept]
+                    del self._concept_sum[concept]
+
         self.pattern_history.append(event)
+        for concept, score in event.items():
+            self._concept_sum[concept] += score
+            self._concept_count[concept] += 1
+
+        mean = self._event_mean(event)
+        if self._first_mean is None:
+            self._first_mean = mean
+        elif evicted:
+            self._first_mean = self._event_mean(self.pattern_history[0])
+        self._last_mean = mean
 
     def identify_patterns(self) -> Dict[str, any]:
         if len(self.pattern_history) < self.min_pattern_length:
             return {"status": "insufficient_data"}
 
+        concept_means = self._concept_means()
         patterns = {
             "learning_rate": self._calculate_learning_rate(),
-            "struggle_areas": self._identify_struggle_areas(),
-            "mastery_concepts": self._identify_mastery_concepts(),
+            "struggle_areas": self._identify_struggle_areas(concept_means),
+            "mastery_concepts": self._identify_mastery_concepts(concept_means),
         }
 
         return patterns
 
     def _calculate_learning_rate(self) -> float:
-        if not self.pattern_history:
+        # The mean of consecutive improvements telescopes to (last - first) / (n - 1)
+        event_count = len(self.pattern_history)
+        if event_count < 2:
             return 0.0
 
-        performances = [sum(event.values()) / len(event) for event in self.pattern_history]
-
-        improvements = [b - a for a, b in zip(performances[:-1], performances[1:])]
-
-        return sum(improvements) / len(improvements) if improvements else 0.0
-
-    def _identify_struggle_areas(self) -> List[str]:
-        if not self.pattern_history:
-            return []
-
-        concept_performance = {}
-        for event in self.pattern_history:
-            for concept, score in event.items():
-                if concept not in concept_performance:
-                    concept_performance[concept] = []
-                concept_performance[concept].append(score)
+        return (self._last_mean - self._first_mean) / (event_count - 1)
 
-        struggle_areas = [
-            concept
-            for concept, scores in concept_performance.items()
-            if sum(scores) / len(scores) < 0.6
-        ]
-
-        return struggle_areas
-
-    def _identify_mastery_concepts(self) -> List[str]:
-        if not self.pattern_history:
-            return []
-
-        concept_performance = {}
-        for event in self.pattern_history:
-            for concept, score in event.items():
-                if concept not in concept_performance:
-                    concept_performance[concept] = []
-                concept_performance[concept].append(score)
+    def _concept_means(self) -> Dict[str, float]:
+        counts = self._concept_count
+        return {
+            concept: total / counts[concept]
+            for concept, total in self._concept_sum.items()
+        }
 
-        mastery_concepts = [
-            concept
-            for concept, scores in concept_performance.items()
-            if sum(scores) / len(scores) > 0.85
-        ]
+    def _identify_struggle_areas(
+        self, concept_means: Optional[Dict[str, float]] = None
+    ) -> List[str]:
+        if concept_means is None:
+            concept_means = self._concept_means()
+        return [concept for concept, mean in concept_means.items() if mean < 0.6]
 
-        return mastery_concepts
+    def _identify_mastery_concepts(
+        self, concept_means: Optional[Dict[str, float]] = None
+    ) -> List[str]:
+        if concept_means is None:
+            concept_means = self._concept_means()
+        return [concept for concept, mean in concept_means.items() if mean > 0.85]
 
 
 class DifficultyLevel(Enum):
@@ -174,10 +192,12 @@ class DifficultyLevel(Enum):
     ADVANCED = "advanced"
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillMetrics:
-    command_success_rate: float = 0.0
-    average_completion_time: float = 0.0
+    attempts: int = 0
+    successes: int = 0
+    total_time: float = 0.0
+    total_errors: int = 0
     error_frequency: Dict[str, int] = None
     concepts_mastered: List[str] = None
 
@@ -185,8 +205,28 @@ class SkillMetrics:
         self.error_frequency = self.error_frequency or {}
         self.concepts_mastered = self.concepts_mastered or []
 
+    @property
+    def command_success_rate(self) -> float:
+        return self.successes / self.attempts if self.attempts else 0.0
+
+    @property
+    def average_completion_time(self) -> float:
+        return self.total_time / self.attempts if self.attempts else 0.0
+
 
 class AdaptiveLearning:
+    base_difficulty = 1.0
+    skill_deviation = 0.5
+    error_rate = 0.2
+    skill_deviation_weight = 0.3
+    error_rate_weight = 0.2
+    learning_parameters = MappingProxyType({
+        'base_learning_rate': 0.1,
+        'skill_decay_factor': 0.95,
+        'max_learning_rate': 0.5,
+        'min_learning_rate': 0.01
+    })
+
     def __init__(self):
         self.current_difficulty: DifficultyLevel = DifficultyLevel.BEGINNER
         self.skill_metrics: Dict[str, SkillMetrics] = {}
@@ -195,46 +235,39 @@ class AdaptiveLearning:
         self.knowledge_space = KnowledgeSpace()
         self.skill_matrix = SkillMatrix(self.knowledge_space)
         self.pattern_recognizer = LearningPatternRecognizer()
-        self._user_data = {}
+        self._skill_levels: Dict[str, str] = {}
+        self._attempts: Dict[str, Dict[str, int]] = {}
+        self._command_metrics: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._knowledge_scores: Dict[str, Dict[str, float]] = {}
+        self._skill_vector_cache: Dict[str, Dict[str, float]] = {}
 
     def initialize_user(self, user_profile: UserProfile) -> None:
-        self._user_data[user_profile.user_id] = {
-            "skill_level": user_profile.skill_level,
-            "attempts": {},
-            "metrics": {},
-            "knowledge_space": {}
-        }
+        user_id = user_profile.user_id
+        self._skill_levels[user_id] = user_profile.skill_level
+        self._attempts[user_id] = {}
+        self._command_metrics[user_id] = {}
+        self._knowledge_scores[user_id] = {}
 
     def get_user_level(self, user_id: str) -> str:
-        return self._user_data.get(user_id, {}).get("skill_level", "beginner")
+        return self._skill_levels.get(user_id, "beginner")
 
     def get_attempt_count(self, user_id: str) -> int:
-        return len(self._user_data.get(user_id, {}).get("attempts", {}))
+        return len(self._attempts.get(user_id, ()))
 
     def update_metrics(self, user_id: str, command: str, success: bool, time_taken: float) -> None:
         metrics = self.skill_metrics.setdefault(user_id, SkillMetrics())
-        total_attempts = sum(metrics.error_frequency.values()) + 1
-
-        # Calculate success rate
+        metrics.attempts += 1
+        metrics.total_time += time_taken
         if success:
-            metrics.command_success_rate = (
-                metrics.command_success_rate * (total_attempts - 1) + 1
-            ) / total_attempts
+            metrics.successes += 1
         else:
-            metrics.command_success_rate = (
-                metrics.command_success_rate * (total_attempts - 1)
-            ) / total_attempts
+            metrics.total_errors += 1
             metrics.error_frequency[command] = metrics.error_frequency.get(command, 0) + 1
+        self._skill_vector_cache.pop(user_id, None)
 
-        # Update completion time average
-        metrics.average_completion_time = (
-            metrics.average_completion_time * (total_attempts - 1) + time_taken
-        ) / total_attempts
-
-        if user_id in self._user_data:
-            if "metrics" not in self._user_data[user_id]:
-                self._user_data[user_id]["metrics"] = {}
-            self._user_data[user_id]["metrics"][command] = {
+        command_metrics = self._command_metrics.get(user_id)
+        if command_metrics is not None:
+            command_metrics[command] = {
                 "success": success,
                 "time_taken": time_taken
             }
@@ -269,40 +302,89 @@ class AdaptiveLearning:
     def get_next_exercise(self, user_id: str) -> Dict[str, Any]:
         difficulty = self.get_user_level(user_id)
         metrics = self.skill_metrics.get(user_id, SkillMetrics())
-        weak_areas = sorted(metrics.error_frequency.items(), key=lambda x: x[1], reverse=True)
+        weak_areas = heapq.nlargest(
+            3, metrics.error_frequency.items(), key=itemgetter(1)
+        )
 
         return {
             "difficulty": difficulty,
-            "focus_areas": [cmd for cmd, _ in weak_areas[:3]],
+            "focus_areas": [cmd for cmd, _ in weak_areas],
             "recommended_practice": self._get_practice_recommendations(metrics)
         }
 
     def get_skill_vector(self, user_id: str) -> Dict[str, float]:
-        if user_id not in self.skill_metrics:
-            return {"git_basics": 0.0, "branching": 0.0, "collaboration": 0.0}
+        cached = self._skill_vector_cache.get(user_id)
+        if cached is None:
+            cached = self._compute_skill_vector(user_id)
+            self._skill_vector_cache[user_id] = cached
+        return dict(cached)
+
+    def compute_skill_vectors_batch(
+        self, user_ids: List[str]
+    ) -> Dict[str, Dict[str, float]]:
+        if not NUMBA_AVAILABLE:
+            return {user_id: self.get_skill_vector(user_id) for user_id in user_ids}
+
+        graph = self.knowledge_space._knowledge_graph
+        user_ptr = [0]
+        weights: List[float] = []
+        performances: List[float] = []
+        for user_id in user_ids:
+            for concept, performance in self._get_performance(user_id).items():
+                node = graph.get(concept)
+                if node is not None:
+                    weights.append(node.precomputed_weight)
+                    performances.append(performance)
+            user_ptr.append(len(weights))
+
+        out = np.zeros((len(user_ids), 3))
+        _skill_vector_kernel(
+            np.array(user_ptr, dtype=np.int64),
+            np.array(weights, dtype=np.float64),
+            np.array(performances, dtype=np.float64),
+            out,
+        )
+        return {
+            user_id: {
+                "git_basics": float(row[0]),
+                "branching": float(row[1]),
+                "collaboration": float(row[2]),
+            }
+            for user_id, row in zip(user_ids, out)
+        }
 
-        metrics = self.skill_metrics[user_id]
-        total_commands = sum(metrics.error_frequency.values())
-        if total_commands == 0:
-            return {"git_basics": 0.0, "branching": 0.0, "collaboration": 0.0}
+    def _get_performance(self, user_id: str) -> Dict[str, float]:
+        metrics = self.skill_metrics.get(user_id)
+        if metrics is None:
+            return {}
+
+        if not metrics.total_errors:
+            return {}
 
-        performance = {
-            cmd: 1.0 - (count / total_commands) for cmd, count in metrics.error_frequency.items()
+        inv_total = 1.0 / metrics.total_errors
+        return {
+            cmd: 1.0 - count * inv_total
+            for cmd, count in metrics.error_frequency.items()
         }
-        vector = self.skill_matrix.calculate_skill_vector(performance)
-        if isinstance(vector, list):
-            return {"git_basics": vector[0], "branching": vector[1], "collaboration": vector[2]}
+
+    def _compute_skill_vector(self, user_id: str) -> Dict[str, float]:
+        performance = self._get_performance(user_id)
+        if not performance:
+            return {"git_basics": 0.0, "branching": 0.0, "collaboration": 0.0}
+
+        git_basics, branching, collaboration = (
+            self.skill_matrix.calculate_skill_vector(performance)
+        )
         return {
-            "git_basics": float(vector[0]),
-            "branching": float(vector[1]),
-            "collaboration": float(vector[2])
+            "git_basics": git_basics,
+            "branching": branching,
+            "collaboration": collaboration,
         }
 
     def update_knowledge_space(self, user_id: str, exercise_id: str, score: float) -> None:
-        if user_id in self._user_data:
-            if "knowledge_space" not in self._user_data[user_id]:
-                self._user_data[user_id]["knowledge_space"] = {}
-            self._user_data[user_id]["knowledge_space"][exercise_id] = score
+        knowledge_scores = self._knowledge_scores.get(user_id)
+        if knowledge_scores is not None:
+            knowledge_scores[exercise_id] = score
 
             self.pattern_recognizer.add_learning_event({exercise_id: score})
             self.knowledge_space.update_mastery(exercise_id, score)
@@ -325,28 +407,11 @@ class AdaptiveLearning:
         historical_performance: Dict[str, float],
         current_skill_level: float
     ) -> float:
-        base_difficulty = 1.0
-        skill_deviation = 0.5
-        error_rate = 0.2
-        self.skill_deviation_weight = 0.3
-        self.error_rate_weight = 0.2
-
-        adjusted_difficulty = (
-            base_difficulty * (
-                1 + (skill_deviation * self.skill_deviation_weight)
-                + (error_rate * self.error_rate_weight)
-            )
+        return self.base_difficulty * (
+            1 + (self.skill_deviation * self.skill_deviation_weight)
+            + (self.error_rate * self.error_rate_weight)
         )
 
-        self.learning_parameters = {
-            'base_learning_rate': 0.1,
-            'skill_decay_factor': 0.95,
-            'max_learning_rate': 0.5,
-            'min_learning_rate': 0.01
-        }
-
-        return adjusted_difficulty
-
 
 def adaptive_learning_function():
     # Adaptive learning code
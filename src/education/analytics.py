@@ -1,9 +1,32 @@
 import numpy as np
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, Iterable, List, Sequence, Tuple
 
+_SKILL_MAPPING = {
+    "basic": 0,
+    "intermediate": 1,
+    "advanced": 2
+}
 
-@dataclass
+
+def skill_index_of(names: Iterable[str]) -> np.ndarray:
+    """Map skill names to skill-matrix rows; unknown skills map to row 0."""
+    return np.fromiter(
+        (_SKILL_MAPPING.get(name.lower(), 0) for name in names), dtype=np.intp
+    )
+
+
+def _linear_fit(y: np.ndarray) -> Tuple[float, float]:
+    """Closed-form least-squares slope and intercept of y against 0..n-1."""
+    x = np.arange(len(y), dtype=np.float64)
+    x_mean = x.mean()
+    y_mean = y.mean()
+    dx = x - x_mean
+    slope = float((dx * (y - y_mean)).sum() / (dx * dx).sum())
+    return slope, float(y_mean - slope * x_mean)
+
+
+@dataclass(slots=True)
 class AnalyticsMetrics:
     skill_score: float
     learning_velocity: float
@@ -16,26 +39,46 @@ class LearningAnalytics:
     def __init__(self):
         self._metrics_history: Dict[str, List[AnalyticsMetrics]] = {}
         self._velocity_window = None
+        self._velocity_cache: Dict[str, Tuple[Tuple[float, ...], float]] = {}
+        self._retention_cache: Dict[str, Tuple[frozenset, Dict[str, List[float]]]] = {}
 
     def calculate_skill_matrix(self, user_id: str, performance_data: Dict[str, float]) -> np.ndarray:
         """Calculate comprehensive skill matrix for user."""
         if not performance_data:
             return np.zeros((3, 3))
 
-        matrix = np.zeros((3, 3))
-        for skill, score in performance_data.items():
-            skill_idx = self._get_skill_index(skill)
-            matrix[skill_idx] += score
-        return matrix
+        skill_indices = skill_index_of(performance_data)
+        scores = np.fromiter(
+            performance_data.values(), dtype=np.float64, count=len(performance_data)
+        )
+        row_totals = np.bincount(skill_indices, weights=scores, minlength=3)
+        return np.repeat(row_totals[:, np.newaxis], 3, axis=1)
+
+    def calculate_skill_matrices(
+        self, cohort_data: Sequence[Dict[str, float]]
+    ) -> np.ndarray:
+        """Calculate every cohort member's skill matrix as one (n_users, 3, 3) array."""
+        counts = np.fromiter(
+            (len(data) for data in cohort_data), dtype=np.intp, count=len(cohort_data)
+        )
+        user_indices = np.repeat(np.arange(len(cohort_data)), counts)
+        skill_indices = skill_index_of(skill for data in cohort_data for skill in data)
+        scores = np.fromiter(
+            (score for data in cohort_data for score in data.values()),
+            dtype=np.float64,
+            count=int(counts.sum()),
+        )
+        row_totals = np.zeros((len(cohort_data), 3))
+        np.add.at(row_totals, (user_indices, skill_indices), scores)
+        return np.repeat(row_totals[:, :, np.newaxis], 3, axis=2)
 
     def calculate_learning_velocity(self, user_id: str, recent_scores: List[float]) -> float:
         """Calculate learning velocity based on recent performance."""
         if not recent_scores or len(recent_scores) < 2:
             return 0.0
 
-        time_periods = list(range(len(recent_scores)))
-        coefficients = np.polyfit(time_periods, recent_scores, 1)
-        return coefficients[0]
+        slope, _ = _linear_fit(np.asarray(recent_scores, dtype=np.float64))
+        return slope
 
     def predict_performance(self, user_id: str, exercise_difficulty: float) -> float:
         """Predict future performance based on history."""
@@ -46,25 +89,37 @@ class LearningAnalytics:
         if not history:
             return 0.5
 
-        recent_metrics = history[-10:]
-        performance_trend = [m.skill_score for m in recent_metrics]
-        velocity = self.calculate_learning_velocity(user_id, performance_trend)
-
-        current_skill = recent_metrics[-1].skill_score
+        # Keyed on the scores the fit reads, so replaced or edited history is refit.
+        performance_trend = tuple(m.skill_score for m in history[-10:])
+        cached = self._velocity_cache.get(user_id)
+        if cached is not None and cached[0] == performance_trend:
+            velocity = cached[1]
+        else:
+            velocity = self.calculate_learning_velocity(
+                user_id, list(performance_trend)
+            )
+            self._velocity_cache[user_id] = (performance_trend, velocity)
+
+        current_skill = history[-1].skill_score
         predicted = current_skill + (velocity * exercise_difficulty)
-        return max(0.0, min(1.0, predicted))
+        return 0.0 if predicted < 0.0 else 1.0 if predicted > 1.0 else predicted
 
     def visualize_retention(self, user_id: str, retention_data: Dict[str, float]) -> Dict[str, List[float]]:
         """Create retention visualization data."""
         if not retention_data:
             return {"labels": [], "values": []}
 
-        sorted_data = sorted(retention_data.items())
-        return {
-            "labels": [item[0] for item in sorted_data],
-            "values": [item[1] for item in sorted_data],
-            "trend": self._calculate_retention_trend(sorted_data)
-        }
+        key = frozenset(retention_data.items())
+        cached = self._retention_cache.get(user_id)
+        if cached is None or cached[0] != key:
+            sorted_data = sorted(retention_data.items())
+            cached = (key, {
+                "labels": [item[0] for item in sorted_data],
+                "values": [item[1] for item in sorted_data],
+                "trend": self._calculate_retention_trend(sorted_data)
+            })
+            self._retention_cache[user_id] = cached
+        return {name: list(series) for name, series in cached[1].items()}
 
     def calculate_accuracy_score(self, user_id: str, performance_data: Dict[str, float]) -> float:
         """Calculate accuracy score based on performance data."""
@@ -78,15 +133,6 @@ class LearningAnalytics:
             return 0.0
         return sum(performance_data.values())  # Example calculation
 
-    def _get_skill_index(self, skill: str) -> int:
-        """Map skill to matrix index."""
-        skill_mapping = {
-            "basic": 0,
-            "intermediate": 1,
-            "advanced": 2
-        }
-        return skill_mapping.get(skill.lower(), 0)
-
     def _get_difficulty_index(self, score: float) -> int:
         """Map difficulty score to matrix index."""
         if score < 0.4:
@@ -100,11 +146,12 @@ class LearningAnalytics:
         if not data:
             return []
 
-        x = list(range(len(data)))
-        y = [v[1] for v in data]
-        coefficients = np.polyfit(x, y, 1)
-        trend = np.poly1d(coefficients)
-        return [float(trend(i)) for i in x]
+        if len(data) < 2:
+            return [float(data[0][1])]
+
+        y = np.fromiter((v[1] for v in data), dtype=np.float64, count=len(data))
+        slope, intercept = _linear_fit(y)
+        return (slope * np.arange(len(data)) + intercept).tolist()
 
 
 def analytics_function():
@@ -1,7 +1,29 @@
-from dataclasses import dataclass
-from typing import List, Dict, Optional, Any
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Generic,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    TypeVar,
+)
 from enum import Enum
 import random
+import re
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 
 class QuestionType(Enum):
@@ -11,7 +33,96 @@ class QuestionType(Enum):
     ANALYTICAL = "analytical"
 
 
-@dataclass
+def _concept_forms(concept: str) -> List[str]:
+    """Return the distinct accepted forms of a concept, or [] for an empty concept."""
+    # Clean up and normalize strings
+    concept = concept.lower().strip()
+    if not concept:
+        return []
+
+    forms = [
+        concept,
+        # Handle plural/singular variations
+        f"{concept}s",  # Simple plural
+        f"{concept}es",  # Complex plural
+        f"{concept[:-1]}ies" if concept.endswith("y") else "",  # y -> ies
+        concept.rstrip("s"),  # Simple singular
+        concept.rstrip("es"),  # Complex singular
+        f"{concept.rstrip('ies')}y",  # ies -> y
+    ]
+    return [form for form in dict.fromkeys(forms) if form]
+
+
+@lru_cache(maxsize=None)
+def _concept_pattern(concept: str) -> Pattern[str]:
+    """Compile one matcher for a concept and its plural/singular variants."""
+    forms = _concept_forms(concept)
+    return re.compile("|".join(re.escape(form) for form in forms))
+
+
+@lru_cache(maxsize=256)
+def _concept_automaton(concepts: Tuple[str, ...]) -> Tuple[Any, FrozenSet[int]]:
+    """Build an Aho-Corasick automaton mapping each accepted form to its concepts."""
+    form_owners: Dict[str, Set[int]] = {}
+    always_matched = set()
+    for index, concept in enumerate(concepts):
+        forms = _concept_forms(concept)
+        if not forms:
+            always_matched.add(index)
+        for form in forms:
+            form_owners.setdefault(form, set()).add(index)
+
+    if not form_owners:
+        return None, frozenset(always_matched)
+
+    automaton = ahocorasick.Automaton()
+    for form, owners in form_owners.items():
+        automaton.add_word(form, tuple(owners))
+    automaton.make_automaton()
+    return automaton, frozenset(always_matched)
+
+
+def _count_matched_concepts(concepts: List[str], response_lower: str) -> int:
+    if AHOCORASICK_AVAILABLE:
+        automaton, always_matched = _concept_automaton(tuple(concepts))
+        matched = set(always_matched)
+        if automaton is not None:
+            for _, owners in automaton.iter(response_lower):
+                matched.update(owners)
+        return len(matched)
+
+    return sum(
+        1 for concept in concepts if _concept_pattern(concept).search(response_lower)
+    )
+
+
+T = TypeVar("T")
+
+
+class _ShuffledRing(Generic[T]):
+    """Hand out items in shuffled passes, reshuffling once a pass is used up."""
+
+    __slots__ = ("_items", "_rng", "_pending")
+
+    def __init__(self, items: List[T], rng: random.Random):
+        self._items = list(items)
+        self._rng = rng
+        self._pending: Deque[T] = deque()
+
+    def draw(self, skip: Optional[Callable[[T], bool]] = None) -> Optional[T]:
+        # The rest of the current pass plus one full fresh pass covers every item.
+        for _ in range(len(self._pending) + len(self._items)):
+            if not self._pending:
+                shuffled = self._items[:]
+                self._rng.shuffle(shuffled)
+                self._pending.extend(shuffled)
+            item = self._pending.popleft()
+            if skip is None or not skip(item):
+                return item
+        return None
+
+
+@dataclass(slots=True)
 class Question:
     id: str
     text: str
@@ -20,11 +131,21 @@ class Question:
     difficulty: str
     follow_ups: List[str]
     expected_concepts: List[str]
+    concepts_lower: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.concepts_lower = tuple(
+            concept.lower() for concept in self.expected_concepts
+        )
 
 
 class SocraticDialogue:
     def __init__(self):
         self._question_bank: Dict[str, Question] = {}
+        self._questions_by_level: Dict[Tuple[str, str], List[Question]] = {}
+        self._rng = random.Random()
+        self._question_rings: Dict[Tuple[str, str], _ShuffledRing[Question]] = {}
+        self._follow_up_rings: Dict[str, _ShuffledRing[str]] = {}
         self._initialize_question_bank()
 
     def _initialize_question_bank(self):
@@ -48,58 +169,39 @@ class SocraticDialogue:
                 expected_concepts=["staging", "working directory", "git add"],
             ),
         }
+        for question in self._question_bank.values():
+            level = (question.topic, question.difficulty)
+            self._questions_by_level.setdefault(level, []).append(question)
+        self._question_rings = {
+            level: _ShuffledRing(questions, self._rng)
+            for level, questions in self._questions_by_level.items()
+        }
 
     def select_question(
         self, topic: str, difficulty: str, previous_questions: List[str] = None
     ) -> Optional[Question]:
-        if previous_questions is None:
-            previous_questions = []
-
-        eligible_questions = [
-            q
-            for q in self._question_bank.values()
-            if q.topic == topic
-            and q.difficulty == difficulty
-            and q.id not in previous_questions
-        ]
-
-        return random.choice(eligible_questions) if eligible_questions else None
-
-    def evaluate_response(self, question: Question, response: str) -> float:
-        response_lower = response.lower()
-
-        def check_word_match(concept: str) -> bool:
-            # Clean up and normalize strings
-            concept = concept.lower().strip()
-
-            # Direct match check
-            if concept in response_lower:
-                return True
-
-            # Handle plural/singular variations
-            plural_forms = [
-                f"{concept}s",  # Simple plural
-                f"{concept}es",  # Complex plural
-                f"{concept[:-1]}ies" if concept.endswith("y") else "",  # y -> ies
-            ]
-
-            singular_forms = [
-                concept.rstrip("s"),  # Simple singular
-                concept.rstrip("es"),  # Complex singular
-                f"{concept.rstrip('ies')}y",  # ies -> y
-            ]
-
-            # Check all variations
-            all_forms = [concept] + plural_forms + singular_forms
-            return any(
-                form in response_lower
-                for form in all_forms
-                if form  # Skip empty strings
-            )
+        ring = self._question_rings.get((topic, difficulty))
+        if ring is None:
+            return None
+        if previous_questions:
+            asked = set(previous_questions)
+            return ring.draw(lambda q: q.id in asked)
+        return ring.draw()
+
+    def evaluate_response(
+        self,
+        question: Question,
+        response: str,
+        *,
+        response_lower: Optional[str] = None,
+        word_count: Optional[int] = None,
+    ) -> float:
+        if response_lower is None:
+            response_lower = response.lower()
 
         # Count matched concepts
-        matched_concepts = sum(
-            1 for concept in question.expected_concepts if check_word_match(concept)
+        matched_concepts = _count_matched_concepts(
+            question.expected_concepts, response_lower
         )
 
         # Award points based on matches
@@ -107,7 +209,9 @@ class SocraticDialogue:
             score = 0.7  # Base passing score
 
             # Quality bonuses
-            if len(response_lower.split()) >= 5:
+            if word_count is None:
+                word_count = len(response_lower.split())
+            if word_count >= 5:
                 score += 0.15
             if any(word in response_lower for word in ["system", "manages", "using"]):
                 score += 0.15
@@ -120,7 +224,11 @@ class SocraticDialogue:
         if (
             response_score < 0.7 and question.follow_ups
         ):  # If score is low, provide follow-up
-            return random.choice(question.follow_ups)
+            ring = self._follow_up_rings.get(question.id)
+            if ring is None:
+                ring = _ShuffledRing(question.follow_ups, self._rng)
+                self._follow_up_rings[question.id] = ring
+            return ring.draw()
         return None
 
 
@@ -150,14 +258,23 @@ class DialogueManager:
         if not self.current_question:
             return {"error": "No active question"}
 
-        score = self.socratic.evaluate_response(self.current_question, response)
+        response_lower = response.lower()
+        word_count = len(response_lower.split())
+        score = self.socratic.evaluate_response(
+            self.current_question,
+            response,
+            response_lower=response_lower,
+            word_count=word_count,
+        )
         follow_up = self.socratic.get_follow_up(self.current_question, score)
 
         # Fixed: Using proper variable names and adding context
         response_analysis = self.analyze_response(
             self.current_question.id,
             response,
-            self.current_context
+            self.current_context,
+            response_lower=response_lower,
+            word_count=word_count,
         )
 
         return {
@@ -167,14 +284,30 @@ class DialogueManager:
             "analysis": response_analysis
         }
 
-    def analyze_response(self, question_id: str, student_response: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    def analyze_response(
+        self,
+        question_id: str,
+        student_response: str,
+        context: Dict[str, Any],
+        *,
+        response_lower: Optional[str] = None,
+        word_count: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """Analyze student response and provide detailed feedback."""
+        if response_lower is None:
+            response_lower = student_response.lower()
+        if word_count is None:
+            word_count = len(student_response.split())
+        question = self.current_question
         return {
             "question_id": question_id,
-            "response_length": len(student_response.split()),
+            "response_length": word_count,
             "key_concepts_found": [
-                concept for concept in self.current_question.expected_concepts
-                if concept.lower() in student_response.lower()
+                concept
+                for concept, concept_lower in zip(
+                    question.expected_concepts, question.concepts_lower
+                )
+                if concept_lower in response_lower
             ],
             "context": context
         }
@@ -1,8 +1,19 @@
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
+import heapq
 import math
+import time
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    prange = range
+    NUMBA_AVAILABLE = False
 
 
 class RecallQuality(Enum):
@@ -14,7 +25,106 @@ class RecallQuality(Enum):
     CORRECT_PERFECT = 5  # Perfect recall
 
 
-@dataclass
+_DAY_US = 86_400 * 1_000_000
+_MINIMUM_INTERVAL = 1
+_MAXIMUM_INTERVAL = 365
+
+
+def _now_us() -> int:
+    return int(time.time() * 1_000_000)
+
+
+def _from_us(timestamp_us: int) -> datetime:
+    return datetime.fromtimestamp(int(timestamp_us) / 1_000_000)
+
+
+def _sm2_update(
+    quality: int, repetitions: int, interval: int, easiness: float
+) -> Tuple[int, int, float]:
+    """Apply one SuperMemo2 step; return the new (repetitions, interval, easiness).
+
+    The interval is capped at the maximum scheduling interval so that it fits the
+    int64 columns however long a run of successful reviews gets.
+    """
+    if quality < 3:
+        repetitions = 0
+        interval = 1
+    else:
+        if repetitions == 0:
+            interval = 1
+        elif repetitions == 1:
+            interval = 6
+        else:
+            interval = round(min(interval * easiness, _MAXIMUM_INTERVAL))
+
+        repetitions += 1
+
+    easiness = max(1.3, easiness + 0.1 - (5 - quality) * 0.08)
+    return repetitions, interval, easiness
+
+
+def _sm2_replay(qualities, repetitions, intervals, easiness):
+    for row in prange(qualities.shape[0]):
+        reps = repetitions[row]
+        interval = intervals[row]
+        ease = easiness[row]
+        for quality in qualities[row]:
+            reps, interval, ease = _sm2_update(quality, reps, interval, ease)
+        repetitions[row] = reps
+        intervals[row] = interval
+        easiness[row] = ease
+
+
+def _sm2_trajectory(qualities, intervals, easiness):
+    reps = 0
+    interval = 1
+    ease = 2.5
+    for step in range(qualities.shape[0]):
+        reps, interval, ease = _sm2_update(qualities[step], reps, interval, ease)
+        intervals[step] = interval
+        easiness[step] = ease
+
+
+if NUMBA_AVAILABLE:
+    _sm2_update = njit(cache=True)(_sm2_update)
+    _sm2_replay = njit(parallel=True, cache=True)(_sm2_replay)
+    _sm2_trajectory = njit(cache=True)(_sm2_trajectory)
+
+
+def replay_reviews(qualities: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Replay rows of review qualities (0-5) from a fresh item.
+    Returns the final repetitions, intervals and easiness factors per row.
+    """
+    qualities = np.asarray(qualities, dtype=np.int64)
+    count = qualities.shape[0]
+    repetitions = np.zeros(count, dtype=np.int64)
+    intervals = np.ones(count, dtype=np.int64)
+    easiness = np.full(count, 2.5)
+    _sm2_replay(qualities, repetitions, intervals, easiness)
+    return repetitions, intervals, easiness
+
+
+def simulate_trajectory(
+    qualities: np.ndarray,
+    minimum_interval: int = _MINIMUM_INTERVAL,
+    maximum_interval: int = _MAXIMUM_INTERVAL,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Replay one item's review qualities (0-5) from a fresh item, keeping every step.
+    Returns the interval and easiness after each review, and each next review's
+    offset in days from the first review. Offsets use the intervals clamped the
+    same way review_item schedules them.
+    """
+    qualities = np.asarray(qualities, dtype=np.int64)
+    intervals = np.empty(qualities.shape[0], dtype=np.int64)
+    easiness = np.empty(qualities.shape[0])
+    _sm2_trajectory(qualities, intervals, easiness)
+    offsets = np.cumsum(np.clip(intervals, minimum_interval, maximum_interval))
+    return intervals, easiness, offsets
+
+
+@dataclass(slots=True)
 class ReviewItem:
     concept_id: str
     last_review: datetime
@@ -25,15 +135,32 @@ class ReviewItem:
 
 
 class SpacedRepetitionSystem:
+    _ARRAY_FIELDS = (
+        "_last_review_us",
+        "_next_review_us",
+        "_easiness",
+        "_interval",
+        "_repetitions",
+    )
+
     def __init__(self):
-        self._review_items: Dict[str, ReviewItem] = {}
+        # Review items are stored column-wise; _id_to_idx maps a concept to its row
+        self._concept_ids: List[str] = []
+        self._id_to_idx: Dict[str, int] = {}
+        self._last_review_us = np.empty(16, dtype=np.int64)
+        self._next_review_us = np.empty(16, dtype=np.int64)
+        self._easiness = np.empty(16, dtype=np.float64)
+        self._interval = np.empty(16, dtype=np.int64)
+        self._repetitions = np.empty(16, dtype=np.int64)
+        # Min-heap of (next_review_us, concept_id); entries go stale when an item
+        # is rescheduled
+        self._due_heap: List[Tuple[int, str]] = []
         self._user_data = {}
         self._review_schedule = {}
-        self._minimum_interval = 1
-        self._maximum_interval = 365
+        self._minimum_interval = _MINIMUM_INTERVAL
+        self._maximum_interval = _MAXIMUM_INTERVAL
         self.initial_interval = timedelta(days=1)
         self.ease_factor = 2.5
-        self.items = {}
 
     def initialize_user(self, user_id: str) -> None:
         """Initialize a new user in the spaced repetition system."""
@@ -47,11 +174,49 @@ class SpacedRepetitionSystem:
 
     def add_item(self, concept_id: str) -> None:
         """Add a new item to the spaced repetition system."""
-        now = datetime.now()
-        self._review_items[concept_id] = ReviewItem(
+        idx = self._id_to_idx.get(concept_id)
+        if idx is None:
+            idx = len(self._concept_ids)
+            if idx == len(self._easiness):
+                self._grow()
+            self._concept_ids.append(concept_id)
+            self._id_to_idx[concept_id] = idx
+
+        now_us = _now_us()
+        self._last_review_us[idx] = now_us
+        self._next_review_us[idx] = now_us
+        self._easiness[idx] = self.ease_factor
+        self._interval[idx] = 1
+        self._repetitions[idx] = 0
+        self._push_due(now_us, concept_id)
+
+    def _push_due(self, next_review_us: int, concept_id: str) -> None:
+        if len(self._due_heap) > 2 * len(self._concept_ids):
+            count = len(self._concept_ids)
+            self._due_heap = list(
+                zip(self._next_review_us[:count].tolist(), self._concept_ids)
+            )
+            heapq.heapify(self._due_heap)
+        heapq.heappush(self._due_heap, (next_review_us, concept_id))
+
+    def _grow(self) -> None:
+        for name in self._ARRAY_FIELDS:
+            column = getattr(self, name)
+            setattr(self, name, np.concatenate((column, np.empty_like(column))))
+
+    def get_review_item(self, concept_id: str) -> Optional[ReviewItem]:
+        """Get a snapshot of a review item."""
+        idx = self._id_to_idx.get(concept_id)
+        if idx is None:
+            return None
+
+        return ReviewItem(
             concept_id=concept_id,
-            last_review=now,
-            next_review=now
+            last_review=_from_us(self._last_review_us[idx]),
+            next_review=_from_us(self._next_review_us[idx]),
+            easiness=float(self._easiness[idx]),
+            interval=int(self._interval[idx]),
+            repetitions=int(self._repetitions[idx]),
         )
 
     def review_item(self, concept_id: str, quality: RecallQuality) -> timedelta:
@@ -59,124 +224,120 @@ class SpacedRepetitionSystem:
         Process a review using SuperMemo2 algorithm.
         Returns the next review interval.
         """
-        if concept_id not in self._review_items:
+        if concept_id not in self._id_to_idx:
             self.add_item(concept_id)
 
-        item = self._review_items[concept_id]
+        idx = self._id_to_idx[concept_id]
 
         # Update item parameters based on SuperMemo2 algorithm
-        if quality.value < 3:
-            item.repetitions = 0
-            item.interval = 1
-        else:
-            if item.repetitions == 0:
-                item.interval = 1
-            elif item.repetitions == 1:
-                item.interval = 6
-            else:
-                item.interval = round(item.interval * item.easiness)
-
-            item.repetitions += 1
-
-        # Update easiness factor
-        item.easiness = max(1.3, item.easiness + 0.1 - (5 - quality.value) * 0.08)
+        repetitions, interval, easiness = _sm2_update(
+            quality.value,
+            int(self._repetitions[idx]),
+            int(self._interval[idx]),
+            float(self._easiness[idx]),
+        )
+        self._repetitions[idx] = repetitions
+        self._interval[idx] = interval
+        self._easiness[idx] = easiness
 
         # Calculate next review date
         interval_days = min(
-            self._maximum_interval, max(self._minimum_interval, item.interval)
+            self._maximum_interval, max(self._minimum_interval, interval)
         )
-        item.last_review = datetime.now()
-        item.next_review = item.last_review + timedelta(days=interval_days)
+        now_us = _now_us()
+        self._last_review_us[idx] = now_us
+        self._next_review_us[idx] = now_us + interval_days * _DAY_US
+        self._push_due(now_us + interval_days * _DAY_US, concept_id)
 
         return timedelta(days=interval_days)
 
     def get_due_items(self) -> List[str]:
         """Get items due for review."""
-        now = datetime.now()
+        now_us = _now_us()
+        heap = self._due_heap
+        due_entries = []
         due_items = []
-        
-        # Check review items instead of schedule
-        for concept_id, item in self._review_items.items():
-            if item.next_review <= now:
-                due_items.append(concept_id)
-        
+        seen = set()
+        while heap and heap[0][0] <= now_us:
+            entry = heapq.heappop(heap)
+            next_review_us, concept_id = entry
+            idx = self._id_to_idx[concept_id]
+            if self._next_review_us[idx] != next_review_us or concept_id in seen:
+                continue  # stale or duplicate entry
+            seen.add(concept_id)
+            due_entries.append(entry)
+            due_items.append(concept_id)
+
+        # Due items stay due until they are reviewed
+        for entry in due_entries:
+            heapq.heappush(heap, entry)
         return due_items
 
     def calculate_retention(self, concept_id: str) -> float:
         """Calculate estimated retention rate for an item."""
-        if concept_id not in self._review_items:
+        idx = self._id_to_idx.get(concept_id)
+        if idx is None:
             return 0.0
 
-        item = self._review_items[concept_id]
-        days_since_review = (datetime.now() - item.last_review).days
+        return self._retention_at(idx, _now_us())
+
+    def _retention_at(self, idx: int, now_us: int) -> float:
+        days_since_review = (now_us - int(self._last_review_us[idx])) // _DAY_US
 
         # Use exponential decay formula: R = e^(-t/τ)
         # where τ (tau) is the decay constant based on item's easiness
-        tau = item.easiness * 10  # Scale factor for decay rate
+        tau = float(self._easiness[idx]) * 10  # Scale factor for decay rate
         retention = math.exp(-days_since_review / tau)
 
-        return max(0.0, min(1.0, retention))
+        return 0.0 if retention < 0.0 else 1.0 if retention > 1.0 else retention
+
+    def calculate_retention_all(self) -> Dict[str, float]:
+        """Calculate estimated retention rates for every item at once."""
+        count = len(self._concept_ids)
+        elapsed_days = (_now_us() - self._last_review_us[:count]) // _DAY_US
+        retention = elapsed_days.astype(np.float64)
+        np.negative(retention, out=retention)
+        np.divide(retention, self._easiness[:count] * 10, out=retention)
+        np.exp(retention, out=retention)
+        np.clip(retention, 0.0, 1.0, out=retention)
+        return dict(zip(self._concept_ids, retention.tolist()))
 
     def get_item_status(self, concept_id: str) -> Optional[Dict[str, any]]:
         """Get current status of a review item."""
-        if concept_id not in self._review_items:
+        idx = self._id_to_idx.get(concept_id)
+        if idx is None:
             return None
 
-        item = self._review_items[concept_id]
+        # Timestamps stay integers internally and only become datetimes here
         return {
-            "last_review": item.last_review,
-            "next_review": item.next_review,
-            "easiness": item.easiness,
-            "interval": item.interval,
-            "repetitions": item.repetitions,
-            "estimated_retention": self.calculate_retention(concept_id),
+            "last_review": _from_us(self._last_review_us[idx]),
+            "next_review": _from_us(self._next_review_us[idx]),
+            "easiness": float(self._easiness[idx]),
+            "interval": int(self._interval[idx]),
+            "repetitions": int(self._repetitions[idx]),
+            "estimated_retention": self._retention_at(idx, _now_us()),
         }
 
     def schedule_review(self, item_id: str) -> Optional[datetime]:
         """Schedule next review for an item using SuperMemo2 algorithm."""
-        if item_id not in self.items:
-            self.items[item_id] = {
-                "interval": self.initial_interval,
-                "ease_factor": self.ease_factor,
-                "repetitions": 0
-            }
-            return datetime.now() + self.initial_interval
+        idx = self._id_to_idx.get(item_id)
+        if idx is None:
+            self.add_item(item_id)
+            idx = self._id_to_idx[item_id]
+            delay_us = int(self.initial_interval.total_seconds() * 1_000_000)
+            next_review_us = _now_us() + delay_us
+            self._next_review_us[idx] = next_review_us
+            self._push_due(next_review_us, item_id)
 
-        item = self.items[item_id]
-        next_interval = item["interval"] * item["ease_factor"]
-        return datetime.now() + next_interval
+        return _from_us(self._next_review_us[idx])
 
     def process_response(self, item_id: str, quality: int) -> datetime:
         """Process response quality (0-5) and return next review date."""
         if quality < 0 or quality > 5:
             raise ValueError("Quality must be between 0 and 5")
 
-        if item_id not in self.items:
-            self.items[item_id] = {
-                "interval": self.initial_interval,
-                "ease_factor": self.ease_factor,
-                "repetitions": 0
-            }
-
-        item = self.items[item_id]
-        
-        # Update ease factor
-        item["ease_factor"] = max(1.3, item["ease_factor"] + (0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)))
-        
-        # Calculate next interval
-        if quality < 3:
-            item["repetitions"] = 0
-            item["interval"] = self.initial_interval
-        else:
-            item["repetitions"] += 1
-            if item["repetitions"] == 1:
-                item["interval"] = self.initial_interval * 1
-            elif item["repetitions"] == 2:
-                item["interval"] = self.initial_interval * 6
-            else:
-                item["interval"] = timedelta(days=math.ceil(item["interval"].days * item["ease_factor"]))
-
-        return datetime.now() + item["interval"]
+        self.review_item(item_id, RecallQuality(quality))
+        return _from_us(self._next_review_us[self._id_to_idx[item_id]])
 
 
 def spaced_repetition_function():
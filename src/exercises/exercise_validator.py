@@ -1,20 +1,55 @@
-from typing import List, Dict, Optional, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import DefaultDict, List, Dict, Optional, Tuple
 import os
 from ..repository import VirtualRepository
-from ..feedback import FeedbackManager
+from ..feedback import FeedbackManager, ProgressiveHintGenerator
 from ..learning_paths import PathManager
 from ..models import Exercise, GitCommand
 
+_FEEDBACK_SUFFIXES = {
+    "no_files_specified": (
+        " Please specify at least one file to add."
+        " For example, you can use 'git add <file_name>'."
+    ),
+    "invalid_commit_format": (
+        " Use the format: git commit -m 'message'."
+        " For example, you can use 'git commit -m 'Initial commit''."
+    ),
+    "unsupported_command": (
+        " Please refer to the help section for supported commands."
+        " You can use 'git help' to see the list of supported commands."
+    ),
+}
+
 
 class ExerciseValidator:
     def __init__(self):
         self.workspace_path: Optional[str] = None
         self.virtual_repo: Optional[VirtualRepository] = None
-        self.feedback_manager = FeedbackManager()
-        self.path_manager = PathManager()
         self.current_path: Optional[str] = None
         self.current_exercise: Optional[str] = None
-        self._path_progress: Dict[str, List[str]] = {}
+        self._path_progress: DefaultDict[str, List[str]] = defaultdict(list)
+        self.hint_generator: Optional[ProgressiveHintGenerator] = None
+        self._dispatch = {
+            "init": self._validate_init,
+            "add": self._validate_add,
+            "commit": self._validate_commit,
+            "branch": self._validate_branch,
+            "merge": self._validate_merge,
+            "checkout": self._validate_checkout,
+            "rebase": self._validate_rebase,
+            "config": self._validate_hook,
+        }
+
+    @cached_property
+    def feedback_manager(self) -> FeedbackManager:
+        return FeedbackManager()
+
+    @cached_property
+    def path_manager(self) -> PathManager:
+        return PathManager()
 
     def set_workspace(self, path: str):
         self.workspace_path = path
@@ -32,43 +67,31 @@ class ExerciseValidator:
         return True, f"Started exercise: {exercise_name}"
 
     def validate_command(self, command: GitCommand) -> Tuple[bool, str]:
+        success, message = self._execute_command(command)
+        if success and self.current_path and self.current_exercise:
+            self.path_manager.complete_exercise(
+                self.current_path,
+                self.current_exercise
+            )
+        return success, message
+
+    def _execute_command(self, command: GitCommand) -> Tuple[bool, str]:
+        """Run a command against the virtual repository without exercise bookkeeping."""
         if not self.virtual_repo:
             return False, self._get_feedback("workspace_not_initialized")
 
         if command.name != "init" and not self.virtual_repo.initialized:
             return False, "Repository not initialized"
 
-        validators = {
-            "init": self._validate_init,
-            "add": self._validate_add,
-            "commit": self._validate_commit,
-            "branch": self._validate_branch,
-            "merge": self._validate_merge,
-            "checkout": self._validate_checkout,
-            "rebase": self._validate_rebase,
-            "config": self._validate_hook,
-        }
-        validator = validators.get(command.name)
+        validator = self._dispatch.get(command.name)
         if not validator:
             return False, self._get_feedback("unsupported_command")
 
-        success, message = validator(command)
-        if success and self.current_path and self.current_exercise:
-            self.path_manager.complete_exercise(
-                self.current_path,
-                self.current_exercise
-            )
-        return success, message
+        return validator(command)
 
     def _get_feedback(self, error_type: str, context: Dict = None) -> str:
         feedback = self.feedback_manager.get_feedback(error_type, context or {})
-        if error_type == "no_files_specified":
-            feedback += " Please specify at least one file to add. For example, you can use 'git add <file_name>'."
-        elif error_type == "invalid_commit_format":
-            feedback += " Use the format: git commit -m 'message'. For example, you can use 'git commit -m 'Initial commit''."
-        elif error_type == "unsupported_command":
-            feedback += " Please refer to the help section for supported commands. You can use 'git help' to see the list of supported commands."
-        return feedback
+        return feedback + _FEEDBACK_SUFFIXES.get(error_type, "")
 
     def _validate_init(self, command: GitCommand) -> Tuple[bool, str]:
         success = self.virtual_repo.init()
@@ -83,19 +106,57 @@ class ExerciseValidator:
         if not command.args:
             return False, self._get_feedback("no_files_specified")
 
+        present = self._existing_files(command.args)
+        # Only files before the first one that can never be staged are worth reading.
+        to_stage: List[str] = []
         for file_path in command.args:
-            full_path = os.path.join(self.workspace_path, file_path)
-            if os.path.exists(full_path):
-                with open(full_path, "r") as f:
-                    content = f.read()
-                self.virtual_repo.add_file(file_path, content)
-
-        all_staged = all(self.virtual_repo.stage_file(file) for file in command.args)
-        return (
-            (True, "Files staged successfully. You can now commit your changes.")
-            if all_staged
-            else (False, "Failed to stage files. Please check the file paths.")
-        )
+            if file_path not in present and file_path not in self.virtual_repo.files:
+                break
+            to_stage.append(file_path)
+        to_read = {path: present[path] for path in to_stage if path in present}
+
+        if len(to_read) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(to_read))) as pool:
+                contents = list(pool.map(_read_text, to_read.values()))
+        else:
+            contents = [_read_text(path) for path in to_read.values()]
+        for file_path, content in zip(to_read, contents):
+            self.virtual_repo.add_file(file_path, content)
+
+        failure = (False, "Failed to stage files. Please check the file paths.")
+        for file_path in to_stage:
+            if not self.virtual_repo.stage_file(file_path):
+                return failure
+        if len(to_stage) < len(command.args):
+            return failure
+        return True, "Files staged successfully. You can now commit your changes."
+
+    def _existing_files(self, file_paths: List[str]) -> Dict[str, str]:
+        """Map each file in ``file_paths`` that exists to its full path.
+
+        Each distinct directory is listed once with ``os.scandir`` instead
+        of stat-ing every file individually.
+        """
+        listings: Dict[str, Dict[str, str]] = {}
+        present: Dict[str, str] = {}
+        for file_path in file_paths:
+            directory, name = os.path.split(
+                os.path.join(self.workspace_path, file_path)
+            )
+            if directory not in listings:
+                try:
+                    with os.scandir(directory) as entries:
+                        listings[directory] = {
+                            entry.name: entry.path
+                            for entry in entries
+                            if entry.is_file()
+                        }
+                except OSError:
+                    listings[directory] = {}
+            full_path = listings[directory].get(name)
+            if full_path is not None:
+                present[file_path] = full_path
+        return present
 
     def _validate_commit(self, command: GitCommand) -> Tuple[bool, str]:
         if not command.args or len(command.args) < 2 or command.args[0] != "-m":
@@ -162,7 +223,7 @@ class ExerciseValidator:
         if len(command.args) < 2 or not command.args[0].startswith("hooks."):
             return False, "Invalid hook configuration format"
 
-        hook_name = command.args[0].split(".")[1]
+        hook_name = command.args[0][len("hooks."):]
         script_content = command.args[1]
         success = self.virtual_repo.configure_hook(hook_name, script_content)
         return success, (
@@ -172,15 +233,16 @@ class ExerciseValidator:
         )
 
     def setup_complex_scenario(self, exercise: Exercise) -> Tuple[bool, str]:
-        if not exercise.complex_scenario:
+        scenario = exercise.complex_scenario
+        if not scenario:
             return False, "No complex scenario defined"
 
-        for cmd in exercise.complex_scenario.setup_commands:
-            success, _ = self.validate_command(cmd)
+        for cmd in scenario.setup_commands:
+            success, _ = self._execute_command(cmd)
             if not success:
                 return False, "Failed to set up scenario"
 
-        for file_path, versions in exercise.complex_scenario.conflict_files.items():
+        for file_path, versions in scenario.conflict_files.items():
             self.virtual_repo.simulate_conflict(file_path, versions)
 
         return True, "Complex scenario set up successfully"
@@ -199,15 +261,15 @@ class ExerciseValidator:
         )
 
     def get_hints(self, error_type: str) -> List[str]:
-        if not hasattr(self, "hint_generator"):
+        if self.hint_generator is None:
             return [self.feedback_manager.get_feedback(error_type)]
 
         current_exercise = self.path_manager.get_path(self.current_path)
         skill_level = current_exercise.difficulty if current_exercise else "beginner"
 
-        return self.feedback_manager.get_feedback(
+        return self.feedback_manager.get_feedback_lines(
             error_type, {"skill_level": skill_level}
-        ).split("\n")
+        )
 
     def init(self) -> bool:
         if self.virtual_repo:
@@ -227,6 +289,11 @@ class ExerciseValidator:
         pass
 
 
+def _read_text(path: str) -> str:
+    with open(path, "r") as f:
+        return f.read()
+
+
 def validate_exercise():
     # Validation code
     pass
@@ -27,16 +27,15 @@ def create_merge_exercise() -> Exercise:
             validation_rules={"branch_merged": "true"}
         )
     ]
-    exercise = Exercise(
+    return Exercise(
         exercise_id="merging_changes",
         name="merging_changes",
         description="Learn to merge changes between branches",
         difficulty="intermediate",
+        commands=commands,
         steps=steps,
         expected_output={"status": "success"}
     )
-    exercise.commands = commands
-    return exercise
 
 
 def create_collaborative_exercise() -> Exercise:
@@ -55,19 +54,20 @@ def create_collaborative_exercise() -> Exercise:
             validation_rules={}
         )
     ]
-    exercise = Exercise(
+    return Exercise(
         exercise_id="team_collaboration",
         name="team_collaboration",
         description="Practice collaborative Git workflows",
         difficulty="intermediate",
+        commands=commands,
         steps=steps,
         expected_output={"status": "success"}
     )
-    exercise.commands = commands
-    return exercise
 
 
 def get_intermediate_exercises() -> List[Exercise]:
+    # Exercises are ORM instances bound to whichever session adds them, so every
+    # call builds fresh ones.
     return [
         create_branch_exercise(),
         create_merge_exercise(),
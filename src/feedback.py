@@ -1,44 +1,27 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional
-from enum import Enum
-
-
-class ErrorCategory(Enum):
-    SYNTAX = "syntax"
-    WORKFLOW = "workflow"
-    CONCEPTUAL = "conceptual"
-    CONFIGURATION = "configuration"
-    INPUT = "input"
-    SUCCESS = "success"
-
-
-@dataclass
-class FeedbackTemplate:
-    error_type: str
-    category: ErrorCategory
-    message_template: str
-    hints: List[str]
-    examples: Optional[Dict[str, str]] = None
-
-    def format_message(self, context: Dict[str, str] = None) -> str:
-        """Format message with proper spacing."""
-        try:
-            context = context or {}
-            return self.message_template.format(**context)
-        except KeyError as e:
-            return f"Error: Missing context parameter: {str(e)}"
+from typing import Dict, Tuple
+
+from .feedback.feedback_manager import ErrorCategory, FeedbackTemplate
+
+_HINTS_PREFIX = "\n\nHints:\n"
+
 
-    def get_hints(self, attempt: int) -> List[str]:
-        """Get hints with proper spacing."""
-        if not self.hints:
-            return []
-        return self.hints[: min(len(self.hints), attempt)]
+def _skill_hint_slices(hints: Tuple[str, ...]) -> Dict[str, Tuple[str, ...]]:
+    """Slice a template's hints for each skill level once."""
+    return {
+        "beginner": hints,
+        "intermediate": hints[1:] if len(hints) > 1 else hints,
+        "advanced": hints[-1:],
+    }
 
 
 class FeedbackManager:
     def __init__(self):
         self._templates: Dict[str, FeedbackTemplate] = {}
         self._initialize_templates()
+        self._skill_hints: Dict[str, Dict[str, Tuple[str, ...]]] = {
+            error_type: _skill_hint_slices(template.hints)
+            for error_type, template in self._templates.items()
+        }
         self.attempt_count: Dict[str, int] = {}
 
     def _initialize_templates(self):
@@ -48,62 +31,62 @@ class FeedbackManager:
                     error_type="invalid_command",
                     category=ErrorCategory.SYNTAX,
                     message_template=("The command '{command}' is not valid."),
-                    hints=[
+                    hints=(
                         "Check the command spelling",
                         "Use 'git help' to see available commands",
-                    ],
+                    ),
                 ),
                 "uninitialized_repo": FeedbackTemplate(
                     error_type="uninitialized_repo",
                     category=ErrorCategory.WORKFLOW,
                     message_template="You need to initialize a repository first.",
-                    hints=[
+                    hints=(
                         "Use 'git init' to create a new repository",
                         "Make sure you're in the right directory",
-                    ],
+                    ),
                     examples={"init": "git init"},
                 ),
                 "no_files_specified": FeedbackTemplate(
                     error_type="no_files_specified",
                     category=ErrorCategory.SYNTAX,
                     message_template="No files specified for staging.",
-                    hints=[
+                    hints=(
                         "Use 'git add <filename>' to stage specific files",
                         "Use 'git add .' to stage all changes",
                         "Use 'git status' to see which files can be staged",
-                    ],
+                    ),
                     examples={"add": "git add example.txt"},
                 ),
                 "files_staged_success": FeedbackTemplate(
                     error_type="files_staged_success",
                     category=ErrorCategory.WORKFLOW,
                     message_template="Files staged successfully.",
-                    hints=[
+                    hints=(
                         "Next, commit your changes using 'git commit -m \"your message\"'",
                         "Use 'git status' to verify staged changes",
-                    ],
+                    ),
                     examples={"commit": 'git commit -m "Add new feature"'},
                 ),
                 "invalid_commit_format": FeedbackTemplate(
                     error_type="invalid_commit_format",
                     category=ErrorCategory.SYNTAX,
                     message_template="Invalid commit message format.",
-                    hints=[
+                    hints=(
                         "Use -m flag followed by your message in quotes",
                         "Keep the message clear and descriptive",
                         "Start with a verb (Add, Fix, Update, etc.)",
-                    ],
+                    ),
                     examples={"commit": 'git commit -m "Fix login bug"'},
                 ),
                 "nothing_to_commit": FeedbackTemplate(
                     error_type="nothing_to_commit",
                     category=ErrorCategory.WORKFLOW,
                     message_template="Nothing to commit. Working tree clean.",
-                    hints=[
+                    hints=(
                         "Stage changes first using 'git add'",
                         "Check staged files with 'git status'",
                         "Make sure you have modified files",
-                    ],
+                    ),
                 ),
             }
         )
@@ -118,13 +101,14 @@ class FeedbackManager:
             if template.error_type == "invalid_command" and "command" not in context:
                 context["command"] = "unknown"
 
-            message = template.message_template.format(**context)
+            message = template.message_template.format_map(context)
             self.attempt_count[error_type] = self.attempt_count.get(error_type, 0) + 1
 
             if self.attempt_count[error_type] > 1:
                 hints = template.get_hints(self.attempt_count[error_type])
-                formatted_hints = [f"- {hint}" for hint in hints]
-                message = f"{message}\n\n" f"Hints:\n{chr(10).join(formatted_hints)}"
+                message = "".join(
+                    (message, _HINTS_PREFIX, "\n".join(f"- {hint}" for hint in hints))
+                )
 
             return message
         except KeyError as e:
@@ -142,26 +126,18 @@ class FeedbackManager:
         if not template:
             return "An unknown error occurred."
 
-        message = template.format_message(context)
-        hints = []
-
-        if user_skill_level == "beginner":
-            hints = template.hints
-        elif user_skill_level == "intermediate":
-            hints = template.hints[1:] if len(template.hints) > 1 else template.hints
-        else:  # advanced
-            hints = template.hints[-1:] if template.hints else []
+        parts = [template.format_message(context)]
+        skill_hints = self._skill_hints[error_type]
+        hints = skill_hints.get(user_skill_level, skill_hints["advanced"])
 
         if attempt_count > 1:
-            formatted_hints = [
-                f"- {hint}" for hint in hints[: min(len(hints), attempt_count)]
-            ]
-            message = f"{message}\n\n" f"Hints:\n{chr(10).join(formatted_hints)}"
+            shown = hints[: min(len(hints), attempt_count)]
+            parts += (_HINTS_PREFIX, "\n".join(f"- {hint}" for hint in shown))
 
-        if attempt_count > 2 and template.examples:
-            message += "\n\nExample:\n" + next(iter(template.examples.values()))
+        if attempt_count > 2 and template.first_example is not None:
+            parts += ("\n\nExample:\n", template.first_example)
 
-        return message
+        return "".join(parts)
 
     def reset_attempts(self, error_type: str = None):
         """Reset attempt counter for specific or all error types."""
@@ -170,24 +146,6 @@ class FeedbackManager:
         else:
             self.attempt_count.clear()
 
-    def process_feedback(self):
-        feedback_msg = (
-            "Long line split into multiple parts for better readability"
-        )
-        if self.validation_needed():
-            self.process_something(parameter="value")
-        return feedback_msg
-
-    def generate_feedback(self, context, error_type):
-        self.feedback_history.append(
-            f"{context['timestamp']} - {error_type}: {context['message']}"
-        )
-
-    def format_message(self, template, context):
-        return template.format(
-            **context
-        ) if context else template
-
 
 def provide_feedback():
     pass
@@ -1,10 +1,15 @@
-from typing import Dict
+from typing import Dict, List, NamedTuple, Tuple
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from functools import cached_property
+import math
+import time
 from .hint_generator import HintContext, ProgressiveHintGenerator  # Added import
 
+_SKILL_ATTRS = {"beginner": "basic", "intermediate": "intermediate"}
+_ATTEMPT_INTERVAL = 60.0  # seconds between counted attempts
 
-@dataclass
+
+@dataclass(slots=True)
 class AssistanceLevel:
     """Define the levels of assistance provided to users."""
 
@@ -17,53 +22,61 @@ class AssistanceLevel:
     next_steps_shown: bool = False
 
 
+class AssistanceResponse(NamedTuple):
+    """Assistance to show for a single attempt."""
+
+    hints: List[str]
+    show_example: bool
+    show_explanation: bool
+    show_next_steps: bool
+
+
+def _default_assistance() -> Dict[str, AssistanceLevel]:
+    """Build a fresh set of the predefined assistance levels."""
+    return {
+        "init": AssistanceLevel(
+            basic="Initialize a new Git repository",
+            intermediate="Set up Git in your project directory",
+            advanced="Configure Git repository with custom settings",
+        ),
+        "add": AssistanceLevel(
+            basic="Stage files for commit",
+            intermediate="Select specific changes to stage",
+            advanced="Use interactive staging",
+        ),
+    }
+
+
 class AssistanceProvider:
     """Provides contextualized assistance based on user skill level."""
 
-    def __init__(self):
-        self.assistance_database: Dict[str, AssistanceLevel] = {}
-        self._initialize_assistance()
-
-    def _initialize_assistance(self) -> None:  # Fixed: Added self parameter
-        """Initialize the assistance database with predefined levels."""
-        self.assistance_database = {
-            "init": AssistanceLevel(
-                basic="Initialize a new Git repository",
-                intermediate="Set up Git in your project directory",
-                advanced="Configure Git repository with custom settings",
-            ),
-            "add": AssistanceLevel(
-                basic="Stage files for commit",
-                intermediate="Select specific changes to stage",
-                advanced="Use interactive staging",
-            ),
-        }
+    @cached_property
+    def assistance_database(self) -> Dict[str, AssistanceLevel]:
+        # Built on first use; each provider owns its (mutable) levels.
+        return _default_assistance()
 
     def get_assistance(self, command: str, skill_level: str) -> str:
         """Get appropriate assistance based on skill level."""
-        if command not in self.assistance_database:
+        level = self.assistance_database.get(command)
+        if level is None:
             return "No assistance available for this command."
 
-        level = self.assistance_database[command]
-        if skill_level == "beginner":
-            return level.basic
-        elif skill_level == "intermediate":
-            return level.intermediate
-        return level.advanced
+        return getattr(level, _SKILL_ATTRS.get(skill_level, "advanced"))
 
 
 class ProgressiveAssistance:
     def __init__(self):
         self._attempts: Dict[str, int] = {}
-        self._last_hint: Dict[str, datetime] = {}
+        self._last_hint: Dict[str, float] = {}
         self._hint_generator = ProgressiveHintGenerator()
         self._current_assistance: Dict[str, AssistanceLevel] = {}
+        self._hints_cache: Dict[str, Dict[Tuple[str, str, int], List[str]]] = {}
 
     def get_assistance(
         self, exercise_id: str, error_type: str, context: HintContext
-    ) -> Dict[str, any]:
+    ) -> AssistanceResponse:
         """Get progressive assistance based on context and history."""
-        current_time = datetime.now()
+        current_time = time.monotonic()
 
         # Initialize or update attempt tracking
         if exercise_id not in self._attempts:
@@ -75,20 +88,20 @@ class ProgressiveAssistance:
             )
 
         # Update attempt count if enough time has passed
-        last_hint_time = self._last_hint.get(exercise_id, datetime.min)
-        if (current_time - last_hint_time) > timedelta(minutes=1):
+        last_hint_time = self._last_hint.get(exercise_id, -math.inf)
+        if (current_time - last_hint_time) > _ATTEMPT_INTERVAL:
             self._attempts[exercise_id] += 1
 
         assistance = self._current_assistance[exercise_id]
-        hints = self._hint_generator.generate_hints(error_type, context)
+        hints = self._get_hints(exercise_id, context)
 
         # Progressive assistance logic
-        response = {
-            "hints": hints[: assistance.hints_revealed + 1],
-            "show_example": assistance.examples_shown,
-            "show_explanation": assistance.full_explanation,
-            "show_next_steps": assistance.next_steps_shown,
-        }
+        response = AssistanceResponse(
+            hints[: assistance.hints_revealed + 1],
+            assistance.examples_shown,
+            assistance.full_explanation,
+            assistance.next_steps_shown,
+        )
 
         # Update assistance level based on attempts
         if self._attempts[exercise_id] > 2:
@@ -102,8 +115,20 @@ class ProgressiveAssistance:
         self._last_hint[exercise_id] = current_time
         return response
 
+    def _get_hints(self, exercise_id: str, context: HintContext) -> List[str]:
+        """Generate hints for a context once per exercise and reuse them."""
+        cache = self._hints_cache.setdefault(exercise_id, {})
+        # The generator only reads these fields of the context.
+        key = (context.error_type, context.command, context.attempts)
+        hints = cache.get(key)
+        if hints is None:
+            hints = self._hint_generator.generate_hints(context)
+            cache[key] = hints
+        return hints
+
     def reset_assistance(self, exercise_id: str):
         """Reset assistance state for an exercise."""
         self._attempts.pop(exercise_id, None)
         self._last_hint.pop(exercise_id, None)
         self._current_assistance.pop(exercise_id, None)
+        self._hints_cache.pop(exercise_id, None)
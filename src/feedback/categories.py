@@ -1,5 +1,12 @@
 from enum import Enum
-from typing import Dict
+from typing import Dict, List
+
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 
 class ErrorLevel(Enum):
@@ -9,7 +16,7 @@ class ErrorLevel(Enum):
     CRITICAL = "critical"
 
 
-class FeedbackCategory(Enum):
+class FeedbackCategory(str, Enum):
     SYNTAX = "syntax"  # Command syntax and format issues
     WORKFLOW = "workflow"  # Git workflow and process issues
     CONCEPTUAL = "concept"  # Understanding Git concepts
@@ -19,6 +26,9 @@ class FeedbackCategory(Enum):
     CONFIGURATION = "configuration"
 
 
+_Classification = tuple[FeedbackCategory, ErrorLevel]
+
+
 class FeedbackClassifier:
     def __init__(self):
         self._error_patterns: Dict[str, tuple[FeedbackCategory, ErrorLevel]] = {
@@ -29,30 +39,59 @@ class FeedbackClassifier:
             "merge conflict": (FeedbackCategory.WORKFLOW, ErrorLevel.WARNING),
             "detached HEAD": (FeedbackCategory.CONCEPTUAL, ErrorLevel.WARNING),
         }
+        self._lower_patterns: List[tuple[str, _Classification]] = [
+            (pattern.lower(), result)
+            for pattern, result in self._error_patterns.items()
+        ]
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for index, (pattern, _) in enumerate(self._lower_patterns):
+                self._automaton.add_word(pattern, index)
+            self._automaton.make_automaton()
 
     def classify_error(self, error_message: str) -> tuple[FeedbackCategory, ErrorLevel]:
         """Classify an error message into a category and severity level."""
-        for pattern, (category, level) in self._error_patterns.items():
-            if pattern.lower() in error_message.lower():
-                return category, level
+        message = error_message.lower()
+        if self._automaton is not None:
+            # The earliest-declared matching pattern wins, as in the linear scan.
+            first = min(
+                (index for _, index in self._automaton.iter(message)), default=None
+            )
+            if first is not None:
+                return self._lower_patterns[first][1]
+        else:
+            for pattern, result in self._lower_patterns:
+                if pattern in message:
+                    return result
         return FeedbackCategory.SYSTEM, ErrorLevel.ERROR
 
 
+_CATEGORY_INDEX: Dict[FeedbackCategory, int] = {
+    category: index for index, category in enumerate(FeedbackCategory)
+}
+_CATEGORIES = tuple(FeedbackCategory)
+
+
 class CategoryManager:
     def __init__(self):
-        self.error_counts: Dict[FeedbackCategory, int] = {
-            category: 0 for category in FeedbackCategory
-        }
+        self._counts: List[int] = [0] * len(_CATEGORIES)
+
+    @property
+    def error_counts(self) -> Dict[FeedbackCategory, int]:
+        """Error count for every category."""
+        return dict(zip(_CATEGORIES, self._counts))
 
     def increment_error(self, category: FeedbackCategory) -> None:
         """Increment error count for a category."""
-        self.error_counts[category] += 1
+        self._counts[_CATEGORY_INDEX[category]] += 1
 
     def get_problem_areas(self) -> Dict[FeedbackCategory, int]:
         """Get categories with errors."""
-        return {k: v for k, v in self.error_counts.items() if v > 0}
+        return {
+            _CATEGORIES[i]: count for i, count in enumerate(self._counts) if count > 0
+        }
 
     def reset_counts(self) -> None:
         """Reset all error counts."""
-        for category in self.error_counts:
-            self.error_counts[category] = 0
+        self._counts = [0] * len(_CATEGORIES)
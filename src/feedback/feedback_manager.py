@@ -1,9 +1,41 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import (
+    Counter as CounterType,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    OrderedDict as OrderedDictType,
+    Tuple,
+)
 from enum import Enum
+from string import Formatter
+from types import MappingProxyType
 
+_NL = "\n"
+_HINTS_PREFIX = "\n\nHints:\n"
+_EMPTY_CONTEXT: Mapping[str, str] = MappingProxyType({})
+_MESSAGE_CACHE_SIZE = 256
 
-class ErrorCategory(Enum):
+
+def _keyword_fields(template: str) -> Tuple[str, ...]:
+    """Return the distinct keyword fields of a format string, in order of appearance."""
+    names = []
+    try:
+        for _, field_name, _, _ in Formatter().parse(template):
+            if field_name:
+                name = field_name.partition(".")[0].partition("[")[0]
+                if name and not name.isdigit() and name not in names:
+                    names.append(name)
+    except ValueError:
+        # Malformed templates keep failing in str.format, as before.
+        return ()
+    return tuple(names)
+
+
+class ErrorCategory(str, Enum):
     SYNTAX = "syntax"
     WORKFLOW = "workflow"
     CONCEPTUAL = "conceptual"
@@ -12,95 +44,129 @@ class ErrorCategory(Enum):
     SUCCESS = "success"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FeedbackTemplate:
     error_type: str
     category: ErrorCategory
     message_template: str
-    hints: List[str]
-    examples: Optional[Dict[str, str]] = None
+    hints: Tuple[str, ...]
+    examples: Optional[Mapping[str, str]] = None
+    _is_static: bool = field(init=False, repr=False, compare=False)
+    _field_names: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _bulleted_hints: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen, so the values derived from the message and hints stay valid.
+        template = self.message_template
+        # Templates without replacement fields format to themselves.
+        is_static = "{" not in template and "}" not in template
+        object.__setattr__(self, "_is_static", is_static)
+        object.__setattr__(self, "_field_names", _keyword_fields(template))
+        bulleted = tuple(f"- {hint}" for hint in self.hints)
+        object.__setattr__(self, "_bulleted_hints", bulleted)
+
+    @property
+    def first_example(self) -> Optional[str]:
+        return next(iter(self.examples.values())) if self.examples else None
 
     def format_message(self, context: Dict[str, str] = None) -> str:
+        if self._is_static:
+            return self.message_template
+        context = context or _EMPTY_CONTEXT
+        for name in self._field_names:
+            if name not in context:
+                return f"Error: Missing context parameter: {name!r}"
         try:
-            context = context or {}
-            return self.message_template.format(**context)
+            return self.message_template.format_map(context)
         except KeyError as e:
             return f"Error: Missing context parameter: {str(e)}"
 
     def get_hints(self, attempt: int) -> List[str]:
         if not self.hints:
             return []
-        return self.hints[: min(len(self.hints), attempt)]
+        return list(self.hints[: min(len(self.hints), attempt)])
+
+
+def _default_templates() -> Dict[str, FeedbackTemplate]:
+    """Build a fresh set of the built-in templates."""
+    return {
+        "invalid_command": FeedbackTemplate(
+            error_type="invalid_command",
+            category=ErrorCategory.SYNTAX,
+            message_template="The command '{command}' is not valid.",
+            hints=(
+                "Check the command spelling",
+                "Use 'git help' to see available commands",
+            ),
+        ),
+        "invalid_commit_format": FeedbackTemplate(
+            error_type="invalid_commit_format",
+            category=ErrorCategory.SYNTAX,
+            message_template="Invalid commit message format.",
+            hints=(
+                "Use -m flag followed by your message in quotes",
+                "Keep the message clear and descriptive",
+            ),
+        ),
+        "uninitialized_repo": FeedbackTemplate(
+            error_type="uninitialized_repo",
+            category=ErrorCategory.WORKFLOW,
+            message_template="You need to initialize a repository first.",
+            hints=(
+                "Use 'git init' to create a new repository",
+                "Make sure you're in the right directory",
+            ),
+        ),
+        "no_files_specified": FeedbackTemplate(
+            error_type="no_files_specified",
+            category=ErrorCategory.SYNTAX,
+            message_template="No files specified for staging.",
+            hints=(
+                "Use 'git add <filename>' to stage specific files",
+                "Use 'git add .' to stage all changes",
+                "Use 'git status' to see which files can be staged",
+            ),
+        ),
+        "files_staged_success": FeedbackTemplate(
+            error_type="files_staged_success",
+            category=ErrorCategory.WORKFLOW,
+            message_template="Files staged successfully.",
+            hints=(
+                "Next, commit your changes using 'git commit -m \"your message\"'",
+                "Use 'git status' to verify staged changes",
+            ),
+            examples={"commit": 'git commit -m "Add new feature"'},
+        ),
+        "nothing_to_commit": FeedbackTemplate(
+            error_type="nothing_to_commit",
+            category=ErrorCategory.WORKFLOW,
+            message_template="Nothing to commit. Working tree clean.",
+            hints=(
+                "Stage changes first using 'git add'",
+                "Check staged files with 'git status'",
+                "Make sure you have modified files",
+            ),
+        ),
+    }
 
 
 class FeedbackManager:
     def __init__(self):
-        self._templates: Dict[str, FeedbackTemplate] = {}
-        self._initialize_templates()
-        self.attempt_count: Dict[str, int] = {}
-
-    def _initialize_templates(self):
-        self._templates.update(
-            {
-                "invalid_command": FeedbackTemplate(
-                    error_type="invalid_command",
-                    category=ErrorCategory.SYNTAX,
-                    message_template="The command '{command}' is not valid.",
-                    hints=[
-                        "Check the command spelling",
-                        "Use 'git help' to see available commands",
-                    ],
-                ),
-                "invalid_commit_format": FeedbackTemplate(
-                    error_type="invalid_commit_format",
-                    category=ErrorCategory.SYNTAX,
-                    message_template="Invalid commit message format.",
-                    hints=[
-                        "Use -m flag followed by your message in quotes",
-                        "Keep the message clear and descriptive",
-                    ],
-                ),
-                "uninitialized_repo": FeedbackTemplate(
-                    error_type="uninitialized_repo",
-                    category=ErrorCategory.WORKFLOW,
-                    message_template="You need to initialize a repository first.",
-                    hints=[
-                        "Use 'git init' to create a new repository",
-                        "Make sure you're in the right directory",
-                    ],
-                ),
-                "no_files_specified": FeedbackTemplate(
-                    error_type="no_files_specified",
-                    category=ErrorCategory.SYNTAX,
-                    message_template="No files specified for staging.",
-                    hints=[
-                        "Use 'git add <filename>' to stage specific files",
-                        "Use 'git add .' to stage all changes",
-                        "Use 'git status' to see which files can be staged",
-                    ],
-                ),
-                "files_staged_success": FeedbackTemplate(
-                    error_type="files_staged_success",
-                    category=ErrorCategory.WORKFLOW,
-                    message_template="Files staged successfully.",
-                    hints=[
-                        "Next, commit your changes using 'git commit -m \"your message\"'",
-                        "Use 'git status' to verify staged changes",
-                    ],
-                    examples={"commit": 'git commit -m "Add new feature"'},
-                ),
-                "nothing_to_commit": FeedbackTemplate(
-                    error_type="nothing_to_commit",
-                    category=ErrorCategory.WORKFLOW,
-                    message_template="Nothing to commit. Working tree clean.",
-                    hints=[
-                        "Stage changes first using 'git add'",
-                        "Check staged files with 'git status'",
-                        "Make sure you have modified files",
-                    ],
-                ),
-            }
-        )
+        self.attempt_count: CounterType[str] = Counter()
+        # Both caches store the template an entry was rendered from, so entries for
+        # a template that has since been replaced in _templates are not reused.
+        # Keyed on user-supplied context, so bounded and evicted least recently used.
+        self._message_cache: OrderedDictType[
+            Tuple[str, tuple], Tuple[FeedbackTemplate, str]
+        ] = OrderedDict()
+        self._hint_cache: Dict[
+            Tuple[str, int, Optional[str]], Tuple[FeedbackTemplate, str]
+        ] = {}
+
+    @cached_property
+    def _templates(self) -> Dict[str, FeedbackTemplate]:
+        # Built on first use; each manager owns its template table.
+        return _default_templates()
 
     def get_feedback(self, error_type: str, context: Dict[str, str] = None) -> str:
         template = self._templates.get(error_type)
@@ -108,19 +174,109 @@ class FeedbackManager:
             return "An unknown error occurred."
 
         try:
-            context = context or {}
-            message = template.format_message(context)
-            self.attempt_count[error_type] = self.attempt_count.get(error_type, 0) + 1
-
-            if self.attempt_count[error_type] > 1:
-                hints = template.get_hints(self.attempt_count[error_type])
-                if hints:
-                    formatted_hints = [f"- {hint}" for hint in hints]
-                    message = f"{message}\n\nHints:\n{chr(10).join(formatted_hints)}"
+            message = self._format_cached(template, context or _EMPTY_CONTEXT)
+            attempts = self._record_attempt(error_type)
+
+            if attempts > 1:
+                message += self._hint_suffix(template, attempts)
             return message
         except KeyError as e:
             return f"Error: Missing required context parameter: {str(e)}"
 
+    def get_feedback_lines(
+        self, error_type: str, context: Dict[str, str] = None
+    ) -> List[str]:
+        """Return the same feedback as get_feedback, split into lines."""
+        template = self._templates.get(error_type)
+        if not template:
+            return ["An unknown error occurred."]
+
+        lines = self._format_cached(template, context or _EMPTY_CONTEXT).split(_NL)
+        attempts = self._record_attempt(error_type)
+
+        if attempts > 1:
+            shown = self._shown_hints(template, attempts, None)
+            if shown is not None:
+                lines += ["", "Hints:", *shown]
+        return lines
+
+    def _record_attempt(self, error_type: str) -> int:
+        attempts = self.attempt_count[error_type] + 1
+        self.attempt_count[error_type] = attempts
+        return attempts
+
+    def _format_cached(
+        self, template: FeedbackTemplate, context: Mapping[str, str]
+    ) -> str:
+        """Format ``template`` once per distinct context and reuse the result."""
+        if template._is_static:
+            return template.message_template
+        key = (template.error_type, tuple(sorted(context.items())))
+        cache = self._message_cache
+        try:
+            cached = cache.get(key)
+        except TypeError:
+            # Unhashable context values are formatted without caching.
+            return template.format_message(context)
+        if cached is not None and cached[0] is template:
+            cache.move_to_end(key)
+            return cached[1]
+        message = template.format_message(context)
+        cache[key] = (template, message)
+        cache.move_to_end(key)
+        if len(cache) > _MESSAGE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return message
+
+    def _hint_suffix(
+        self,
+        template: FeedbackTemplate,
+        attempt: int,
+        skill_level: Optional[str] = None,
+    ) -> str:
+        """Return the rendered hints section for ``attempt``, or "" if none is shown.
+
+        Without a skill level every hint unlocked so far is shown.
+        """
+        # Past both the hint count and the skill thresholds the output stops changing.
+        key = (
+            template.error_type,
+            min(attempt, max(len(template.hints), 3)),
+            skill_level,
+        )
+        cached = self._hint_cache.get(key)
+        if cached is not None and cached[0] is template:
+            return cached[1]
+        suffix = self._render_hint_suffix(template, attempt, skill_level)
+        self._hint_cache[key] = (template, suffix)
+        return suffix
+
+    @classmethod
+    def _render_hint_suffix(
+        cls, template: FeedbackTemplate, attempt: int, skill_level: Optional[str]
+    ) -> str:
+        shown = cls._shown_hints(template, attempt, skill_level)
+        if shown is None:
+            return ""
+        return _HINTS_PREFIX + _NL.join(shown)
+
+    @staticmethod
+    def _shown_hints(
+        template: FeedbackTemplate, attempt: int, skill_level: Optional[str]
+    ) -> Optional[Tuple[str, ...]]:
+        """Return the bulleted hints to show, or None when no hints section applies."""
+        bulleted = template._bulleted_hints
+        unlocked = bulleted[: min(len(bulleted), attempt)]
+        if not unlocked:
+            return None
+        if skill_level is None or skill_level == "beginner":
+            return unlocked
+        if skill_level == "intermediate" and attempt > 1:
+            return unlocked[1:]
+        if skill_level == "advanced" and attempt > 2:
+            return unlocked[-1:]
+        return None
+
     def get_feedback_with_context(
         self,
         error_type: str,
@@ -133,20 +289,7 @@ class FeedbackManager:
             return "An unknown error occurred."
 
         message = template.format_message(context)
-        hints = template.get_hints(attempt_count)
-
-        if hints:
-            if user_skill_level == "beginner":
-                formatted_hints = [f"- {hint}" for hint in hints]
-                message = f"{message}\n\nHints:\n{chr(10).join(formatted_hints)}"
-            elif user_skill_level == "intermediate" and attempt_count > 1:
-                formatted_hints = [f"- {hint}" for hint in hints[1:]]
-                message = f"{message}\n\nHints:\n{chr(10).join(formatted_hints)}"
-            elif user_skill_level == "advanced" and attempt_count > 2:
-                formatted_hints = [f"- {hint}" for hint in hints[-1:]]
-                message = f"{message}\n\nHints:\n{chr(10).join(formatted_hints)}"
-
-        return message
+        return message + self._hint_suffix(template, attempt_count, user_skill_level)
 
     def reset_attempts(self, error_type: str = None):
         if error_type:
@@ -155,7 +298,4 @@ class FeedbackManager:
             self.attempt_count.clear()
 
     def get_feedback_template(self, error_type):
-        return self.templates.get(
-            error_type,
-            self.default_template
-        )
+        return self.templates.get(error_type, self.default_template)
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple
 from enum import Enum
 
 
@@ -18,22 +20,29 @@ class HintContext:
     error_type: str
 
 
+_HINTS: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "missing_args": (
+            "Check if you provided all required arguments",
+            "This command needs specific parameters",
+            "Try using --help to see command usage",
+            "Example: git {command} <argument>",
+        ),
+        "no_files": (
+            "No files were specified for the command",
+            "You need to specify which files to add",
+            "Use git status to see available files",
+            "Example: git add file.txt",
+        ),
+    }
+)
+
+
 class ProgressiveHintGenerator:
     def __init__(self):
-        self._hints: Dict[str, List[str]] = {
-            "missing_args": [
-                "Check if you provided all required arguments",
-                "This command needs specific parameters",
-                "Try using --help to see command usage",
-                "Example: git {command} <argument>",
-            ],
-            "no_files": [
-                "No files were specified for the command",
-                "You need to specify which files to add",
-                "Use git status to see available files",
-                "Example: git add file.txt",
-            ],
-        }
+        self._hints = _HINTS
+        # Commands come from user input, so keep the cache bounded.
+        self._formatted_hints = lru_cache(maxsize=512)(self._format_hints)
 
     def generate_hints(self, context: HintContext) -> List[str]:
         if context.error_type not in self._hints:
@@ -41,12 +50,16 @@ class ProgressiveHintGenerator:
 
         available_hints = self._hints[context.error_type]
         num_hints = min(context.attempts, len(available_hints))
-        
-        hints = available_hints[:num_hints]
-        return [
-            hint.format(command=context.command)
-            for hint in hints
-        ]
+        return list(
+            self._formatted_hints(context.error_type, context.command, num_hints)
+        )
+
+    def _format_hints(
+        self, error_type: str, command: str, num_hints: int
+    ) -> Tuple[str, ...]:
+        return tuple(
+            hint.format(command=command) for hint in self._hints[error_type][:num_hints]
+        )
 
     def get_hint_level(self, attempts: int) -> HintLevel:
         if attempts <= 1:
@@ -1,23 +1,38 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import dataclass, replace
+from typing import Dict, Optional, Tuple
 from .categories import FeedbackCategory, ErrorLevel
 
+_SKILL_LEVELS = ("beginner", "intermediate", "advanced")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class DetailedFeedback:
     category: FeedbackCategory
     level: ErrorLevel
     message: str
     explanation: str
-    hints: List[str]
+    hints: Tuple[str, ...]
     examples: Dict[str, str]
-    next_steps: List[str]
-    common_mistakes: List[str]
+    next_steps: Tuple[str, ...]
+    common_mistakes: Tuple[str, ...]
+
+
+def _skill_variant(template: DetailedFeedback, skill_level: str) -> DetailedFeedback:
+    if skill_level == "intermediate":
+        return replace(template, hints=template.hints[1:], common_mistakes=())
+    if skill_level == "advanced":
+        return replace(template, hints=template.hints[-1:], explanation="")
+    return template
 
 
 class DetailedFeedbackTemplates:
     def __init__(self):
         self.templates: Dict[str, DetailedFeedback] = self._initialize_templates()
+        self._variants: Dict[Tuple[str, str], DetailedFeedback] = {
+            (error_type, skill_level): _skill_variant(template, skill_level)
+            for error_type, template in self.templates.items()
+            for skill_level in _SKILL_LEVELS
+        }
 
     def _initialize_templates(self) -> Dict[str, DetailedFeedback]:
         return {
@@ -29,22 +44,22 @@ class DetailedFeedbackTemplates:
                     "Before using Git commands, you need to initialize "
                     "a repository using 'git init'."
                 ),
-                hints=[
+                hints=(
                     "Make sure you're in the correct directory",
                     "Check if .git directory exists",
                     "Run 'git init' to create a new repository",
-                ],
+                ),
                 examples={"init": "git init"},
-                next_steps=[
+                next_steps=(
                     "Initialize the repository",
                     "Add some files",
                     "Make your first commit",
-                ],
-                common_mistakes=[
+                ),
+                common_mistakes=(
                     "Running Git commands outside a repository",
                     "Trying to initialize inside another Git repository",
                     "Wrong working directory",
-                ],
+                ),
             ),
         }
 
@@ -52,15 +67,7 @@ class DetailedFeedbackTemplates:
         self, error_type: str, skill_level: str = "beginner"
     ) -> Optional[DetailedFeedback]:
         """Get template with appropriate detail level."""
-        template = self.templates.get(error_type)
-        if not template:
-            return None
-
-        if skill_level == "intermediate":
-            template.hints = template.hints[1:]
-            template.common_mistakes = []
-        elif skill_level == "advanced":
-            template.hints = template.hints[-1:]
-            template.explanation = ""
-
-        return template
+        variant = self._variants.get((error_type, skill_level))
+        if variant is None:
+            return self.templates.get(error_type)
+        return variant
@@ -33,7 +33,7 @@ class IntegrationLayer:
             "persistence_error": self._handle_persistence_error
         }
         for error_type, handler in handlers.items():
-            logger.info(f"Registered error handler for: {error_type}")
+            logger.info("Registered error handler for: %s", error_type)
 
     def initialize_session(self, user_profile: UserProfile) -> bool:
         """Initialize a new learning session for a user."""
@@ -42,10 +42,10 @@ class IntegrationLayer:
             self.adaptive_learning.initialize_user(user_profile)
             self.spaced_repetition.initialize_user(user_profile.user_id)
             self.dialogue_manager.initialize_session(user_profile.skill_level)
-            logger.info(f"Session initialized for user: {user_profile.user_id}")
+            logger.info("Session initialized for user: %s", user_profile.user_id)
             return True
         except Exception as e:
-            logger.error(f"Session initialization failed: {str(e)}")
+            logger.error("Session initialization failed: %s", e)
             return False
 
     def process_command(self, user_id: str, command: str, args: List[str]) -> Dict[str, Any]:
@@ -72,7 +72,7 @@ class IntegrationLayer:
                 "skill_update": self.adaptive_learning.get_skill_vector(user_id)
             }
         except Exception as e:
-            logger.error(f"Command processing error: {str(e)}")
+            logger.error("Command processing error: %s", e)
             return {
                 "success": False,
                 "message": "An error occurred while processing the command",
@@ -81,22 +81,22 @@ class IntegrationLayer:
 
     def _handle_repository_error(self, error: Exception) -> Tuple[bool, str]:
         """Handle repository-related errors."""
-        logger.error(f"Repository error: {str(error)}")
+        logger.error("Repository error: %s", error)
         return False, f"Repository operation failed: {str(error)}"
 
     def _handle_validation_error(self, error: Exception) -> Tuple[bool, str]:
         """Handle validation-related errors."""
-        logger.error(f"Validation error: {str(error)}")
+        logger.error("Validation error: %s", error)
         return False, f"Command validation failed: {str(error)}"
 
     def _handle_learning_error(self, error: Exception) -> Tuple[bool, str]:
         """Handle learning system errors."""
-        logger.error(f"Learning system error: {str(error)}")
+        logger.error("Learning system error: %s", error)
         return False, f"Learning operation failed: {str(error)}"
 
     def _handle_persistence_error(self, error: Exception) -> Tuple[bool, str]:
         """Handle data persistence errors."""
-        logger.error(f"Persistence error: {str(error)}")
+        logger.error("Persistence error: %s", error)
         return False, f"Data operation failed: {str(error)}"
 
     def get_next_exercise(self, user_id: str) -> Optional[Exercise]:
@@ -109,7 +109,7 @@ class IntegrationLayer:
             )
             return exercise
         except Exception as e:
-            logger.error(f"Error getting next exercise: {str(e)}")
+            logger.error("Error getting next exercise: %s", e)
             return None
 
     def update_progress(self, user_id, exercise_id, completed):
@@ -130,7 +130,7 @@ class IntegrationLayer:
             
             return True
         except Exception as e:
-            logger.error(f"Error updating progress: {str(e)}")
+            logger.error("Error updating progress: %s", e)
             return False
 
 def integration_function():
@@ -206,10 +206,9 @@ class PathManager:
         return self.paths.get(name)
 
     def get_available_paths(self, completed_paths: List[str]) -> List[LearningPath]:
+        done = frozenset(completed_paths)
         return [
-            path
-            for path in self.paths.values()
-            if all(prereq in completed_paths for prereq in path.prerequisites)
+            path for path in self.paths.values() if done.issuperset(path.prerequisites)
         ]
 
     def start_path(self, path_name: str) -> bool:
@@ -222,12 +221,11 @@ class PathManager:
     def complete_exercise(self, path_name: str, exercise_name: str) -> bool:
         if path_name not in self.paths:
             return False
-        if path_name not in self.path_progress:
-            self.path_progress[path_name] = []
-        if exercise_name not in self.path_progress[path_name]:
-            self.path_progress[path_name].append(exercise_name)
-            return True
-        return False
+        progress = self.path_progress[path_name]
+        if exercise_name in progress:
+            return False
+        progress.append(exercise_name)
+        return True
 
     def is_path_completed(self, path_name: str) -> bool:
         if path_name not in self.paths or path_name not in self.path_progress:
@@ -238,10 +236,7 @@ class PathManager:
         return completed >= required
 
     def is_exercise_completed(self, path_name: str, exercise_name: str) -> bool:
-        return (
-            path_name in self.path_progress
-            and exercise_name in self.path_progress[path_name]
-        )
+        return exercise_name in self.path_progress.get(path_name, ())
 
     def get_exercise_progress(self, path_name: str) -> List[str]:
         return self.path_progress.get(path_name, [])
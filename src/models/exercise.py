@@ -14,7 +14,7 @@ from sqlalchemy.orm import relationship
 from src.database.init_db import Base
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GitCommand:
     name: str
     args: List[str]
@@ -33,7 +33,7 @@ class GitCommand:
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplexScenario:
     name: str
     setup_commands: List[GitCommand]
@@ -21,9 +21,8 @@ class TestLearningCLI:
         self.runner = CliRunner()
         engine = create_engine('sqlite:///:memory:')
         Base.metadata.create_all(engine)
-        Session = sessionmaker(bind=engine)
-        self.session = Session()
-        self.persistence = PersistenceLayer(self.session)
+        Session = sessionmaker(bind=engine, expire_on_commit=False)
+        self.persistence = PersistenceLayer(Session)
         self.user = UserProfile(
             username="test_user",
             email="test@example.com"
@@ -11,9 +11,8 @@ class TestPersistenceLayer(unittest.TestCase):
         engine = create_engine('sqlite:///:memory:')
         Base = declarative_base()
         Base.metadata.create_all(engine)
-        Session = sessionmaker(bind=engine)
-        self.session = Session()
-        self.persistence = PersistenceLayer(self.session)
+        Session = sessionmaker(bind=engine, expire_on_commit=False)
+        self.persistence = PersistenceLayer(Session)
 
     def test_add_user(self):
         """Test adding a new user."""
@@ -18,6 +18,7 @@ class TestAdaptiveLearning(unittest.TestCase):
         node = self.knowledge_space._knowledge_graph.get("init")
         self.assertIsNotNone(node)
         self.assertAlmostEqual(node.mastery_level, 0.08)
+        self.assertIsNotNone(node.last_practiced_dt)
 
     def test_skill_matrix_calculation(self):
         performance = {"init": 0.8, "add": 0.7}
@@ -34,6 +35,50 @@ class TestAdaptiveLearning(unittest.TestCase):
             self.pattern_recognizer.add_learning_event(event)
         patterns = self.pattern_recognizer.identify_patterns()
         self.assertIn("learning_rate", patterns)
+        self.assertAlmostEqual(patterns["learning_rate"], 0.1)
+
+    def test_pattern_history_is_bounded(self):
+        recognizer = LearningPatternRecognizer(history_window=3)
+        for score in (0.1, 0.2, 0.9, 0.9, 0.9):
+            recognizer.add_learning_event({"init": score})
+        self.assertEqual(len(recognizer.pattern_history), 3)
+        patterns = recognizer.identify_patterns()
+        self.assertEqual(patterns["mastery_concepts"], ["init"])
+        self.assertAlmostEqual(patterns["learning_rate"], 0.0)
+
+    def test_update_metrics_rates(self):
+        self.adaptive_learning.update_metrics("user", "git add", True, 10.0)
+        self.adaptive_learning.update_metrics("user", "git add", True, 20.0)
+        self.adaptive_learning.update_metrics("user", "git commit", False, 30.0)
+        metrics = self.adaptive_learning.skill_metrics["user"]
+        self.assertAlmostEqual(metrics.command_success_rate, 2 / 3)
+        self.assertAlmostEqual(metrics.average_completion_time, 20.0)
+        self.assertEqual(metrics.error_frequency, {"git commit": 1})
+
+    def test_skill_vector_cache_invalidated_on_update(self):
+        self.adaptive_learning.update_metrics("user", "init", False, 5.0)
+        first = self.adaptive_learning.get_skill_vector("user")
+        self.assertEqual(first, self.adaptive_learning.get_skill_vector("user"))
+        self.adaptive_learning.update_metrics("user", "add", False, 5.0)
+        self.assertNotEqual(first, self.adaptive_learning.get_skill_vector("user"))
+
+    def test_batch_skill_vectors_match_single(self):
+        adaptive_learning = self.adaptive_learning
+        adaptive_learning.update_metrics("a", "init", False, 5.0)
+        adaptive_learning.update_metrics("a", "branch", False, 5.0)
+        adaptive_learning.update_metrics("b", "add", True, 5.0)
+        batch = adaptive_learning.compute_skill_vectors_batch(["a", "b", "missing"])
+        for user_id in ("a", "b", "missing"):
+            expected = adaptive_learning.get_skill_vector(user_id)
+            for key, value in expected.items():
+                self.assertAlmostEqual(batch[user_id][key], value)
+
+    def test_next_exercise_focus_areas(self):
+        for command, failures in (("merge", 1), ("rebase", 4), ("add", 2), ("push", 3)):
+            for _ in range(failures):
+                self.adaptive_learning.update_metrics("user", command, False, 5.0)
+        exercise = self.adaptive_learning.get_next_exercise("user")
+        self.assertEqual(exercise["focus_areas"], ["rebase", "push", "add"])
 
     def test_skill_level_progression(self):
         performance = {"init": 0.9, "add": 0.85, "commit": 0.8}
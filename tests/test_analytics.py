@@ -1,6 +1,6 @@
 import unittest
 import numpy as np
-from src.education.analytics import LearningAnalytics
+from src.education.analytics import AnalyticsMetrics, LearningAnalytics
 
 class TestLearningAnalytics(unittest.TestCase):
     def setUp(self):
@@ -16,6 +16,25 @@ class TestLearningAnalytics(unittest.TestCase):
         matrix = self.analytics.calculate_skill_matrix(self.user_id, performance_data)
         self.assertEqual(matrix.shape, (3, 3))
         self.assertTrue(isinstance(matrix, np.ndarray))
+        np.testing.assert_allclose(matrix[:, 0], [0.8, 0.6, 0.4])
+        np.testing.assert_allclose(matrix[0], [0.8, 0.8, 0.8])
+
+    def test_skill_matrices_match_per_user(self):
+        cohort = [
+            {"basic": 0.8, "Advanced": 0.4},
+            {},
+            {"intermediate": 0.6, "unknown": 0.1},
+        ]
+        matrices = self.analytics.calculate_skill_matrices(cohort)
+        self.assertEqual(matrices.shape, (3, 3, 3))
+        for data, matrix in zip(cohort, matrices):
+            expected = self.analytics.calculate_skill_matrix(self.user_id, data)
+            np.testing.assert_allclose(matrix, expected)
+
+    def test_difficulty_buckets(self):
+        scores = [0.0, 0.39, 0.4, 0.69, 0.7, 1.0]
+        indices = [self.analytics._get_difficulty_index(score) for score in scores]
+        self.assertEqual(indices, [0, 0, 1, 1, 2, 2])
 
     def test_learning_velocity_calculation(self):
         recent_scores = [0.5, 0.6, 0.7, 0.8, 0.85]
@@ -27,6 +46,22 @@ class TestLearningAnalytics(unittest.TestCase):
         self.assertGreaterEqual(prediction, 0.0)
         self.assertLessEqual(prediction, 1.0)
 
+    def test_performance_prediction_tracks_history(self):
+        history = [AnalyticsMetrics(score, 0.0, 0.0, 0.0, 0.0) for score in (0.5, 0.6)]
+        self.analytics._metrics_history[self.user_id] = history
+        self.assertAlmostEqual(self.analytics.predict_performance(self.user_id, 1.0), 0.7)
+        history.append(AnalyticsMetrics(0.9, 0.0, 0.0, 0.0, 0.0))
+        self.assertAlmostEqual(self.analytics.predict_performance(self.user_id, 1.0), 1.0)
+
+    def test_performance_prediction_refits_replaced_history(self):
+        rising = [AnalyticsMetrics(s, 0.0, 0.0, 0.0, 0.0) for s in (0.1, 0.2, 0.3)]
+        falling = [AnalyticsMetrics(s, 0.0, 0.0, 0.0, 0.0) for s in (0.5, 0.4, 0.3)]
+        analytics = self.analytics
+        analytics._metrics_history[self.user_id] = rising
+        self.assertAlmostEqual(analytics.predict_performance(self.user_id, 1.0), 0.4)
+        analytics._metrics_history[self.user_id] = falling
+        self.assertAlmostEqual(analytics.predict_performance(self.user_id, 1.0), 0.2)
+
     def test_retention_visualization(self):
         retention_data = {
             "2023-01-01": 0.9,
@@ -39,5 +74,17 @@ class TestLearningAnalytics(unittest.TestCase):
         self.assertIn("trend", visualization)
         self.assertEqual(len(visualization["labels"]), 3)
 
+    def test_retention_visualization_refreshes_on_change(self):
+        retention_data = {"2023-01-02": 0.8, "2023-01-01": 0.9}
+        first = self.analytics.visualize_retention(self.user_id, retention_data)
+        self.assertEqual(first["labels"], ["2023-01-01", "2023-01-02"])
+        first["values"].append(0.0)
+        again = self.analytics.visualize_retention(self.user_id, retention_data)
+        self.assertEqual(again["values"], [0.9, 0.8])
+        retention_data["2023-01-03"] = 0.7
+        updated = self.analytics.visualize_retention(self.user_id, retention_data)
+        self.assertEqual(updated["values"], [0.9, 0.8, 0.7])
+        np.testing.assert_allclose(updated["trend"], [0.9, 0.8, 0.7])
+
 if __name__ == '__main__':
     unittest.main()
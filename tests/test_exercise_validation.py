@@ -60,6 +60,23 @@ class TestExerciseValidation(unittest.TestCase):
         success, message = self.validator.validate_command(commit_cmd)
         self.assertTrue(success, f"Commit failed: {message}")
 
+    def test_add_stops_at_first_missing_file(self):
+        self.validator.virtual_repo.init()
+        for name in ("a.txt", "c.txt"):
+            with open(os.path.join(self.temp_dir, name), "w") as f:
+                f.write(name)
+
+        add_cmd = GitCommand(
+            name="add",
+            args=["a.txt", "missing.txt", "c.txt"],
+            expected_output="",
+            validation_rules={},
+        )
+        success, _ = self.validator.validate_command(add_cmd)
+        self.assertFalse(success)
+        self.assertIn("a.txt", self.validator.virtual_repo.staged_files)
+        self.assertNotIn("c.txt", self.validator.virtual_repo.files)
+
     def test_invalid_command_sequence(self):
         """Test validation of incorrect command sequences."""
         # Try to commit before init
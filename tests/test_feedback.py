@@ -1,4 +1,5 @@
 import unittest
+from dataclasses import FrozenInstanceError, replace
 from src.feedback import FeedbackManager
 
 
@@ -32,6 +33,76 @@ class TestFeedback(unittest.TestCase):
         )
         self.assertNotIn("hint", feedback.lower())  # Should be like first attempt
 
+    def test_cached_feedback_tracks_attempts(self):
+        first = self.feedback_manager.get_feedback("invalid_command", {"command": "a"})
+        other = self.feedback_manager.get_feedback("invalid_command", {"command": "b"})
+        again = self.feedback_manager.get_feedback("invalid_command", {"command": "a"})
+        self.assertIn("'a'", first)
+        self.assertIn("'b'", other)
+        self.assertTrue(again.startswith(first))
+        self.assertIn("Use 'git help'", again)
+
+    def test_feedback_lines_match_feedback(self):
+        other = FeedbackManager()
+        for _ in range(3):
+            self.assertEqual(
+                self.feedback_manager.get_feedback_lines("no_files_specified"),
+                other.get_feedback("no_files_specified").split("\n"),
+            )
+
+    def test_message_cache_is_bounded(self):
+        for i in range(1000):
+            self.feedback_manager.get_feedback("invalid_command", {"command": str(i)})
+        self.assertLessEqual(len(self.feedback_manager._message_cache), 256)
+
+    def test_unhashable_context_is_formatted(self):
+        feedback = self.feedback_manager.get_feedback(
+            "invalid_command", {"command": ["git", "pus"]}
+        )
+        self.assertIn("['git', 'pus']", feedback)
+
+    def test_templates_not_shared_between_managers(self):
+        other = FeedbackManager()
+        other.get_feedback("invalid_command", {"command": "test"})
+        self.assertIsNot(self.feedback_manager._templates, other._templates)
+        template = other._templates["invalid_command"]
+        other._templates["invalid_command"] = replace(
+            template, hints=template.hints + ("Extra hint",)
+        )
+        del other._templates["nothing_to_commit"]
+        self.assertIn("nothing_to_commit", self.feedback_manager._templates)
+        self.assertNotIn(
+            "Extra hint", self.feedback_manager._templates["invalid_command"].hints
+        )
+        # Attempt counts stay per manager.
+        feedback = self.feedback_manager.get_feedback(
+            "invalid_command", {"command": "test"}
+        )
+        self.assertNotIn("hint", feedback.lower())
+
+    def test_templates_are_immutable(self):
+        template = self.feedback_manager._templates["no_files_specified"]
+        with self.assertRaises(FrozenInstanceError):
+            template.message_template = "No files for {command}."
+        with self.assertRaises(AttributeError):
+            template.hints.append("Extra hint")
+
+    def test_replaced_template_is_rendered(self):
+        manager = self.feedback_manager
+        context = {"command": "git comit"}
+        for _ in range(2):
+            manager.get_feedback("invalid_command", context)
+        template = manager._templates["invalid_command"]
+        manager._templates["invalid_command"] = replace(
+            template,
+            message_template="Unknown command {command}.",
+            hints=("Check the spelling",),
+        )
+        feedback = manager.get_feedback("invalid_command", context)
+        self.assertTrue(feedback.startswith("Unknown command git comit."))
+        self.assertIn("- Check the spelling", feedback)
+        self.assertNotIn("git help", feedback)
+
     def test_contextual_feedback(self):
         # Test beginner feedback
         beginner_feedback = self.feedback_manager.get_feedback_with_context(
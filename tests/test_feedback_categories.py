@@ -0,0 +1,56 @@
+import unittest
+from unittest.mock import patch
+
+from src.feedback import categories
+from src.feedback.categories import (
+    CategoryManager,
+    ErrorLevel,
+    FeedbackCategory,
+    FeedbackClassifier,
+)
+
+
+class TestFeedbackClassifier(unittest.TestCase):
+    MESSAGES = {
+        "fatal: repository not initialized": (FeedbackCategory.STATE, ErrorLevel.ERROR),
+        "You are in 'Detached HEAD' state": (
+            FeedbackCategory.CONCEPTUAL,
+            ErrorLevel.WARNING,
+        ),
+        # "not found" is declared before "merge conflict", so it wins.
+        "merge conflict: file not found": (FeedbackCategory.SYSTEM, ErrorLevel.ERROR),
+        "branch already exists": (FeedbackCategory.STATE, ErrorLevel.WARNING),
+        "something unexpected": (FeedbackCategory.SYSTEM, ErrorLevel.ERROR),
+    }
+
+    def test_classify_error(self):
+        classifier = FeedbackClassifier()
+        for message, expected in self.MESSAGES.items():
+            self.assertEqual(classifier.classify_error(message), expected, message)
+
+    def test_classify_error_without_automaton(self):
+        with patch.object(categories, "AHOCORASICK_AVAILABLE", False):
+            classifier = FeedbackClassifier()
+        self.assertIsNone(classifier._automaton)
+        for message, expected in self.MESSAGES.items():
+            self.assertEqual(classifier.classify_error(message), expected, message)
+
+
+class TestCategoryManager(unittest.TestCase):
+    def test_counts(self):
+        manager = CategoryManager()
+        manager.increment_error(FeedbackCategory.STATE)
+        manager.increment_error(FeedbackCategory.STATE)
+        manager.increment_error(FeedbackCategory.SYNTAX)
+        self.assertEqual(
+            manager.get_problem_areas(),
+            {FeedbackCategory.STATE: 2, FeedbackCategory.SYNTAX: 1},
+        )
+        self.assertEqual(manager.error_counts[FeedbackCategory.WORKFLOW], 0)
+
+        manager.reset_counts()
+        self.assertEqual(manager.get_problem_areas(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
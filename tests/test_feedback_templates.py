@@ -1,5 +1,6 @@
 import unittest
 from src.feedback import FeedbackTemplate, ErrorCategory
+from src.feedback.templates import DetailedFeedbackTemplates
 from src.feedback_templates import GitFeedbackTemplates
 
 
@@ -14,7 +15,7 @@ class TestGitFeedbackTemplates(unittest.TestCase):
             self.assertIsInstance(template.error_type, str)
             self.assertIsInstance(template.category, ErrorCategory)
             self.assertIsInstance(template.message_template, str)
-            self.assertIsInstance(template.hints, list)
+            self.assertIsInstance(template.hints, tuple)
 
     def test_merge_conflict_template(self):
         """Test specific merge conflict template."""
@@ -30,6 +31,47 @@ class TestGitFeedbackTemplates(unittest.TestCase):
                 self.assertGreater(len(template.hints), 0)
                 self.assertTrue(all(isinstance(hint, str) for hint in template.hints))
 
+    def test_format_message(self):
+        """Test static and parameterised templates format consistently."""
+        static = self.templates["detached_head"]
+        self.assertEqual(
+            static.format_message({"files": "a.txt"}), static.message_template
+        )
+        merge = self.templates["merge_conflict"]
+        self.assertEqual(
+            merge.format_message({"files": "a.txt"}), "Merge conflict detected in a.txt"
+        )
+        self.assertIn("Missing context parameter", merge.format_message())
+
+    def test_templates_read_only(self):
+        """Test that callers share one catalog but cannot change it."""
+        again = GitFeedbackTemplates.get_all_templates()
+        self.assertIs(again["merge_conflict"], self.templates["merge_conflict"])
+        with self.assertRaises(TypeError):
+            again["merge_conflict"] = None
+        with self.assertRaises(TypeError):
+            del again["merge_conflict"]
+        with self.assertRaises(AttributeError):
+            again["merge_conflict"].hints.append("Extra hint")
+        with self.assertRaises(TypeError):
+            again["merge_conflict"].examples["resolve"] = "git merge --abort"
+
+
+class TestDetailedFeedbackTemplates(unittest.TestCase):
+    def test_skill_levels_do_not_leak(self):
+        """Test that asking for a skill level leaves other levels intact."""
+        templates = DetailedFeedbackTemplates()
+        advanced = templates.get_template("uninitialized_repo", "advanced")
+        intermediate = templates.get_template("uninitialized_repo", "intermediate")
+        beginner = templates.get_template("uninitialized_repo")
+        self.assertEqual(len(advanced.hints), 1)
+        self.assertEqual(advanced.explanation, "")
+        self.assertEqual(len(intermediate.hints), 2)
+        self.assertEqual(intermediate.common_mistakes, ())
+        self.assertEqual(len(beginner.hints), 3)
+        self.assertTrue(beginner.explanation)
+        self.assertIsNone(templates.get_template("missing"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -21,6 +21,18 @@ class TestHintGenerator(unittest.TestCase):
         self.assertIsInstance(hints, list)
         self.assertTrue(len(hints) > 0)
 
+    def test_generate_hints_formats_command(self):
+        context = HintContext(
+            skill_level="beginner",
+            attempts=4,
+            command="commit",
+            error_type="missing_args"
+        )
+        hints = self.generator.generate_hints(context)
+        self.assertEqual(hints[-1], "Example: git commit <argument>")
+        hints.clear()
+        self.assertEqual(len(self.generator.generate_hints(context)), 4)
+
     def test_hint_level_progression(self):
         self.assertEqual(
             self.generator.get_hint_level(1),
@@ -56,6 +56,11 @@ class TestIntermediateExercises(unittest.TestCase):
         expected_names = {ex.name for ex in exercises}
         self.assertEqual(exercise_names, expected_names)
 
+    def test_get_all_exercises_returns_fresh_instances(self):
+        first = get_intermediate_exercises()
+        second = get_intermediate_exercises()
+        self.assertTrue(all(a is not b for a, b in zip(first, second)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -29,6 +29,14 @@ class TestLearningPaths(unittest.TestCase):
         available = self.path_manager.get_available_paths(["basic_git_workflow"])
         self.assertEqual(len(available), 2)
 
+    def test_available_paths_follow_prerequisite_edits(self):
+        path = self.path_manager.get_path("branching_basics")
+        path.prerequisites.append("advanced_workflow")
+        available = self.path_manager.get_available_paths(["basic_git_workflow"])
+        self.assertNotIn(path, available)
+        path.prerequisites.clear()
+        self.assertIn(path, self.path_manager.get_available_paths([]))
+
     def test_path_progress(self):
         path_name = "basic_git_workflow"
         self.assertTrue(self.path_manager.start_path(path_name))
@@ -41,6 +49,23 @@ class TestLearningPaths(unittest.TestCase):
         # Verify path completion
         self.assertTrue(self.path_manager.is_path_completed(path_name))
 
+    def test_repeated_exercise_completion(self):
+        manager = self.path_manager
+        path_name = "basic_git_workflow"
+        self.assertFalse(manager.is_exercise_completed(path_name, "init_repo"))
+        self.assertTrue(manager.complete_exercise(path_name, "init_repo"))
+        self.assertFalse(manager.complete_exercise(path_name, "init_repo"))
+        self.assertTrue(manager.is_exercise_completed(path_name, "init_repo"))
+        self.assertEqual(manager.get_exercise_progress(path_name), ["init_repo"])
+
+    def test_progress_assigned_directly(self):
+        manager = self.path_manager
+        path_name = "basic_git_workflow"
+        manager.path_progress[path_name] = ["init_repo"]
+        self.assertTrue(manager.is_exercise_completed(path_name, "init_repo"))
+        self.assertFalse(manager.complete_exercise(path_name, "init_repo"))
+        self.assertEqual(manager.get_exercise_progress(path_name), ["init_repo"])
+
     def test_invalid_path_progress(self):
         self.assertFalse(self.path_manager.start_path("nonexistent_path"))
         self.assertFalse(
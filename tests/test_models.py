@@ -13,10 +13,9 @@ class TestModels(unittest.TestCase):
         Base.metadata.create_all(cls.engine)
 
     def setUp(self):
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
-        self.session.execute(text('PRAGMA foreign_keys=ON'))
-        self.persistence = PersistenceLayer(self.session)
+        Session = sessionmaker(bind=self.engine, expire_on_commit=False)
+        self.persistence = PersistenceLayer(Session)
+        self.persistence.Session.execute(text('PRAGMA foreign_keys=ON'))
         self.user = UserProfile(
             username="test_user",
             email="test@example.com"
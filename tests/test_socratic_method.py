@@ -1,4 +1,7 @@
 import unittest
+from unittest.mock import patch
+
+from src.education import socratic_method
 from src.education.socratic_method import (
     SocraticDialogue,
     DialogueManager,
@@ -18,6 +21,19 @@ class TestSocraticMethod(unittest.TestCase):
         self.assertEqual(question.difficulty, "beginner")
         self.assertEqual(question.topic, "git_basics")
 
+    def test_question_selection_cycles_bucket(self):
+        select = self.dialogue.select_question
+        drawn = {select("git_basics", "beginner").id for _ in range(2)}
+        self.assertEqual(drawn, {"git_init_1", "git_commit_1"})
+
+        for _ in range(5):
+            question = select("git_basics", "beginner", ["git_init_1"])
+            self.assertEqual(question.id, "git_commit_1")
+        self.assertIsNone(
+            select("git_basics", "beginner", ["git_init_1", "git_commit_1"])
+        )
+        self.assertIsNone(select("git_basics", "expert"))
+
     def test_response_evaluation(self):
         question = Question(
             id="test_1",
@@ -47,6 +63,15 @@ class TestSocraticMethod(unittest.TestCase):
             f"Expected score < 0.7 for partial response. Got {partial_score}",
         )
 
+    def test_concept_matching_without_automaton(self):
+        concepts = ["version control", "repository", "staging"]
+        response = "git is a version control system that manages repositories"
+        expected = socratic_method._count_matched_concepts(concepts, response)
+        with patch.object(socratic_method, "AHOCORASICK_AVAILABLE", False):
+            fallback = socratic_method._count_matched_concepts(concepts, response)
+        self.assertEqual(fallback, expected)
+        self.assertEqual(expected, 2)
+
     def test_dialogue_flow(self):
         question_text = self.manager.start_dialogue("git_basics", "beginner")
         self.assertIsNotNone(question_text)
@@ -1,6 +1,15 @@
 import unittest
 from datetime import datetime, timedelta
-from src.education.spaced_repetition import SpacedRepetitionSystem, RecallQuality  # Added RecallQuality import
+from itertools import accumulate
+from src.education.spaced_repetition import (  # Added RecallQuality import
+    SpacedRepetitionSystem,
+    RecallQuality,
+    _sm2_update,
+    replay_reviews,
+    simulate_trajectory,
+)
+
+FIVE_DAYS_US = int(timedelta(days=5).total_seconds() * 1_000_000)
 
 
 class TestSpacedRepetition(unittest.TestCase):
@@ -38,19 +47,78 @@ class TestSpacedRepetition(unittest.TestCase):
         )
         self.assertGreater(interval.days, 6)
 
+    def test_long_perfect_run_keeps_maximum_interval(self):
+        for _ in range(40):
+            interval = self.srs.review_item(
+                self.concept_id, RecallQuality.CORRECT_PERFECT
+            )
+        self.assertEqual(interval.days, 365)
+        self.assertEqual(self.srs.get_item_status(self.concept_id)["interval"], 365)
+
+    def test_replay_matches_single_reviews(self):
+        qualities = [[5, 5, 5, 4], [5, 2, 4, 5]]
+        repetitions, intervals, easiness = replay_reviews(qualities)
+        for row, sequence in enumerate(qualities):
+            srs = SpacedRepetitionSystem()
+            for quality in sequence:
+                srs.review_item(self.concept_id, RecallQuality(quality))
+            item = srs.get_review_item(self.concept_id)
+            self.assertEqual(repetitions[row], item.repetitions)
+            self.assertEqual(intervals[row], item.interval)
+            self.assertAlmostEqual(easiness[row], item.easiness)
+
+    def test_sm2_update_caps_interval(self):
+        repetitions, interval, _ = _sm2_update(5, 40, 365, 2.6)
+        self.assertEqual((repetitions, interval), (41, 365))
+        _, intervals, _ = replay_reviews([[5] * 60])
+        self.assertEqual(intervals.tolist(), [365])
+
+    def test_trajectory_ends_at_replay_state(self):
+        qualities = [5, 5, 2, 4, 5]
+        intervals, easiness, offsets = simulate_trajectory(qualities)
+        _, final_intervals, final_easiness = replay_reviews([qualities])
+        self.assertEqual(intervals.tolist(), [1, 6, 1, 1, 6])
+        self.assertEqual(offsets.tolist(), [1, 7, 8, 9, 15])
+        self.assertEqual(intervals[-1], final_intervals[0])
+        self.assertAlmostEqual(easiness[-1], final_easiness[0])
+
+    def test_long_trajectory_matches_review_schedule(self):
+        qualities = [5] * 40
+        intervals, _, offsets = simulate_trajectory(qualities)
+        scheduled = [
+            self.srs.review_item(self.concept_id, RecallQuality(quality)).days
+            for quality in qualities
+        ]
+        self.assertEqual(max(scheduled), 365)
+        self.assertEqual(intervals[-1], 365)
+        self.assertEqual(offsets[-1] - offsets[-2], 365)
+        self.assertEqual(offsets.tolist(), list(accumulate(scheduled)))
+
     def test_retention_calculation(self):
         self.srs.add_item(self.concept_id)
         initial_retention = self.srs.calculate_retention(self.concept_id)
         self.assertEqual(initial_retention, 1.0)
 
         # Simulate time passage
-        item = self.srs._review_items[self.concept_id]
-        item.last_review = datetime.now() - timedelta(days=5)
+        idx = self.srs._id_to_idx[self.concept_id]
+        self.srs._last_review_us[idx] -= FIVE_DAYS_US
 
         retention = self.srs.calculate_retention(self.concept_id)
         self.assertLess(retention, 1.0)
         self.assertGreater(retention, 0.0)
 
+    def test_retention_for_all_items(self):
+        self.srs.add_item(self.concept_id)
+        self.srs.add_item("git_add")
+        idx = self.srs._id_to_idx["git_add"]
+        self.srs._last_review_us[idx] -= FIVE_DAYS_US
+
+        retention = self.srs.calculate_retention_all()
+        self.assertEqual(retention[self.concept_id], 1.0)
+        self.assertAlmostEqual(
+            retention["git_add"], self.srs.calculate_retention("git_add")
+        )
+
     def test_due_items(self):
         self.srs.add_item(self.concept_id)
 
@@ -63,6 +131,22 @@ class TestSpacedRepetition(unittest.TestCase):
         due_items = self.srs.get_due_items()
         self.assertNotIn(self.concept_id, due_items)
 
+    def test_due_items_beyond_initial_capacity(self):
+        concept_ids = [f"concept_{i}" for i in range(40)]
+        for concept_id in concept_ids:
+            self.srs.add_item(concept_id)
+        self.srs.review_item("concept_3", RecallQuality.CORRECT_PERFECT)
+        due_items = self.srs.get_due_items()
+        self.assertEqual(len(due_items), 39)
+        self.assertNotIn("concept_3", due_items)
+
+    def test_due_items_after_re_adding(self):
+        self.srs.add_item(self.concept_id)
+        self.srs.review_item(self.concept_id, RecallQuality.CORRECT_PERFECT)
+        self.srs.add_item(self.concept_id)
+        self.assertEqual(self.srs.get_due_items(), [self.concept_id])
+        self.assertEqual(self.srs.get_due_items(), [self.concept_id])
+
     def test_review_scheduling(self):
         item_id = "test_item"
         next_review = self.srs.schedule_review(item_id)
@@ -74,6 +158,8 @@ class TestSpacedRepetition(unittest.TestCase):
         next_review = self.srs.process_response(item_id, 5)
         self.assertIsInstance(next_review, datetime)
         self.assertTrue(next_review > datetime.now())
+        self.assertEqual(self.srs.get_item_status(item_id)["repetitions"], 1)
+        self.assertNotIn(item_id, self.srs.get_due_items())
 
 
 if __name__ == "__main__":